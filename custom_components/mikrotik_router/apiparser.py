@@ -1,9 +1,10 @@
 """API parser for JSON APIs."""
+from __future__ import annotations
+
 from datetime import datetime
 from logging import getLogger
 
 from pytz import utc
-from voluptuous import Optional
 
 from homeassistant.components.diagnostics import async_redact_data
 
@@ -143,7 +144,7 @@ def parse_api(
 # ---------------------------
 #   get_uid
 # ---------------------------
-def get_uid(entry, key, key_secondary, key_search, keymap) -> Optional(str):
+def get_uid(entry, key, key_secondary, key_search, keymap) -> str | None:
     """Get UID for data list."""
     uid = None
     if not key_search:
@@ -172,7 +173,7 @@ def get_uid(entry, key, key_secondary, key_search, keymap) -> Optional(str):
 # ---------------------------
 #   generate_keymap
 # ---------------------------
-def generate_keymap(data, key_search) -> Optional(dict):
+def generate_keymap(data, key_search) -> dict | None:
     """Generate keymap."""
     return (
         {data[uid][key_search]: uid for uid in data if key_search in data[uid]}
@@ -222,11 +223,11 @@ def fill_defaults(data, vals) -> dict:
     """Fill defaults if source is not present."""
     for val in vals:
         _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
+        _type = val.get("type", "str")
+        _source = val.get("source", _name)
 
         if _type == "str":
-            _default = val["default"] if "default" in val else ""
+            _default = val.get("default", "")
             if "default_val" in val and val["default_val"] in val:
                 _default = val[val["default_val"]]
 
@@ -234,8 +235,8 @@ def fill_defaults(data, vals) -> dict:
                 data[_name] = from_entry([], _source, default=_default)
 
         elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
+            _default = val.get("default", False)
+            _reverse = val.get("reverse", False)
             if _name not in data:
                 data[_name] = from_entry_bool(
                     [], _source, default=_default, reverse=_reverse
@@ -251,12 +252,12 @@ def fill_vals(data, entry, uid, vals) -> dict:
     """Fill all data."""
     for val in vals:
         _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-        _convert = val["convert"] if "convert" in val else None
+        _type = val.get("type", "str")
+        _source = val.get("source", _name)
+        _convert = val.get("convert")
 
         if _type == "str":
-            _default = val["default"] if "default" in val else ""
+            _default = val.get("default", "")
             if "default_val" in val and val["default_val"] in val:
                 _default = val[val["default_val"]]
 
@@ -266,8 +267,8 @@ def fill_vals(data, entry, uid, vals) -> dict:
                 data[_name] = from_entry(entry, _source, default=_default)
 
         elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
+            _default = val.get("default", False)
+            _reverse = val.get("reverse", False)
 
             if uid:
                 data[uid][_name] = from_entry_bool(
@@ -302,12 +303,10 @@ def fill_ensure_vals(data, uid, ensure_vals) -> dict:
     for val in ensure_vals:
         if uid:
             if val["name"] not in data[uid]:
-                _default = val["default"] if "default" in val else ""
-                data[uid][val["name"]] = _default
+                data[uid][val["name"]] = val.get("default", "")
 
         elif val["name"] not in data:
-            _default = val["default"] if "default" in val else ""
-            data[val["name"]] = _default
+            data[val["name"]] = val.get("default", "")
 
     return data
 
@@ -321,7 +320,7 @@ def fill_vals_proc(data, uid, vals_proc) -> dict:
     for val_sub in vals_proc:
         _name = None
         _action = None
-        _value = None
+        _parts = []
         for val in val_sub:
             if "name" in val:
                 _name = val["name"]
@@ -336,13 +335,12 @@ def fill_vals_proc(data, uid, vals_proc) -> dict:
 
             if _action == "combine":
                 if "key" in val:
-                    tmp = _data[val["key"]] if val["key"] in _data else "unknown"
-                    _value = f"{_value}{tmp}" if _value else tmp
+                    _parts.append(str(_data.get(val["key"], "unknown")))
 
                 if "text" in val:
-                    tmp = val["text"]
-                    _value = f"{_value}{tmp}" if _value else tmp
+                    _parts.append(val["text"])
 
+        _value = "".join(_parts)
         if _name and _value:
             if uid:
                 data[uid][_name] = _value
@@ -90,11 +90,6 @@ class MikrotikPPPSecretBinarySensor(MikrotikBinarySensor):
             else False
         )
 
-    # @property
-    # def available(self) -> bool:
-    #     """Return if controller is available."""
-    #     return self._ctrl.connected() if self.option_sensor_ppp else False
-
 
 # ---------------------------
 #   MikrotikPortBinarySensor
@@ -109,11 +104,6 @@ class MikrotikPortBinarySensor(MikrotikBinarySensor):
             CONF_SENSOR_PORT_TRACKER, DEFAULT_SENSOR_PORT_TRACKER
         )
 
-    # @property
-    # def available(self) -> bool:
-    #     """Return if controller is available."""
-    #     return self._ctrl.connected() if self.option_sensor_port_tracker else False
-
     @property
     def icon(self) -> str:
         """Return the icon."""
@@ -131,20 +121,24 @@ class MikrotikPortBinarySensor(MikrotikBinarySensor):
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
         attributes = super().extra_state_attributes
+        data = self._data
 
-        if self._data["type"] == "ether":
+        if data["type"] == "ether":
             for variable in DEVICE_ATTRIBUTES_IFACE_ETHER:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
-            if "sfp-shutdown-temperature" in self._data:
+            if "sfp-shutdown-temperature" in data:
                 for variable in DEVICE_ATTRIBUTES_IFACE_SFP:
-                    if variable in self._data:
-                        attributes[format_attribute(variable)] = self._data[variable]
+                    value = data.get(variable)
+                    if value is not None:
+                        attributes[format_attribute(variable)] = value
 
-        elif self._data["type"] == "wlan":
+        elif data["type"] == "wlan":
             for variable in DEVICE_ATTRIBUTES_IFACE_WIRELESS:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
         return attributes
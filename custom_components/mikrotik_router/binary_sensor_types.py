@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.components.binary_sensor import (
@@ -12,16 +11,16 @@ from homeassistant.components.binary_sensor import (
 
 from .const import DOMAIN
 
-DEVICE_ATTRIBUTES_PPP_SECRET = [
+DEVICE_ATTRIBUTES_PPP_SECRET = (
     "connected",
     "service",
     "profile",
     "comment",
     "caller-id",
     "encoding",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE = [
+DEVICE_ATTRIBUTES_IFACE = (
     "running",
     "enabled",
     "comment",
@@ -34,18 +33,18 @@ DEVICE_ATTRIBUTES_IFACE = [
     "actual-mtu",
     "type",
     "name",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_ETHER = [
+DEVICE_ATTRIBUTES_IFACE_ETHER = (
     "status",
     "auto-negotiation",
     "rate",
     "full-duplex",
     "default-name",
     "poe-out",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_SFP = [
+DEVICE_ATTRIBUTES_IFACE_SFP = (
     "status",
     "auto-negotiation",
     "advertising",
@@ -66,9 +65,9 @@ DEVICE_ATTRIBUTES_IFACE_SFP = [
     "sfp-vendor-serial",
     "sfp-manufacturing-date",
     "eeprom-checksum",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
+DEVICE_ATTRIBUTES_IFACE_WIRELESS = (
     "ssid",
     "mode",
     "radio-name",
@@ -89,9 +88,9 @@ DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
     "wds-default-bridge",
     "bridge-mode",
     "hide-ssid",
-]
+)
 
-DEVICE_ATTRIBUTES_UPS = [
+DEVICE_ATTRIBUTES_UPS = (
     "name",
     "offline-time",
     "min-runtime",
@@ -106,9 +105,9 @@ DEVICE_ATTRIBUTES_UPS = [
     "line-voltage",
     "load",
     "hid-self-test",
-]
+)
 
-DEVICE_ATTRIBUTES_NETWATCH = [
+DEVICE_ATTRIBUTES_NETWATCH = (
     "host",
     "type",
     "interval",
@@ -116,7 +115,7 @@ DEVICE_ATTRIBUTES_NETWATCH = [
     "http-codes",
     "status",
     "comment",
-]
+)
 
 
 @dataclass
@@ -134,7 +133,7 @@ class MikrotikBinarySensorEntityDescription(BinarySensorEntityDescription):
     data_name_comment: bool = False
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: list = field(default_factory=lambda: [])
     func: str = "MikrotikBinarySensor"
 
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
 
 from homeassistant.components.sensor import (
     SensorEntityDescription,
@@ -10,10 +9,10 @@ from homeassistant.components.sensor import (
 
 from .const import DOMAIN
 
-DEVICE_ATTRIBUTES_SCRIPT = [
+DEVICE_ATTRIBUTES_SCRIPT = (
     "last-started",
     "run-count",
-]
+)
 
 
 @dataclass
@@ -29,7 +28,7 @@ class MikrotikButtonEntityDescription(SensorEntityDescription):
     data_name_comment: bool = False
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: list = field(default_factory=lambda: [])
     func: str = "MikrotikButton"
 
 
@@ -27,6 +27,9 @@ DEFAULT_SSL = False
 
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30
+# Refresh interval for rarely-changing data (access rights, firmware,
+# capabilities, routerboard, scripts, DHCP networks, static DNS)
+HWINFO_REFRESH_INTERVAL = 4 * 60 * 60
 CONF_TRACK_IFACE_CLIENTS = "track_iface_clients"
 DEFAULT_TRACK_IFACE_CLIENTS = True
 CONF_TRACK_HOSTS = "track_network_hosts"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
@@ -9,12 +10,15 @@ import pytz
 
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from functools import lru_cache
 from ipaddress import ip_address, IPv4Network
 from mac_vendor_lookup import AsyncMacLookup
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import utcnow
 
@@ -38,6 +42,7 @@ from .const import (
     DEFAULT_TRACK_HOSTS,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    HWINFO_REFRESH_INTERVAL,
     CONF_SENSOR_PORT_TRAFFIC,
     DEFAULT_SENSOR_PORT_TRAFFIC,
     CONF_SENSOR_CLIENT_TRAFFIC,
@@ -71,6 +76,206 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIME_ZONE = None
 
+_HOST_DEFAULTS = (
+    ("address", "unknown"),
+    ("mac-address", "unknown"),
+    ("interface", "unknown"),
+    ("host-name", "unknown"),
+    ("manufacturer", "detect"),
+    ("last-seen", False),
+    ("available", False),
+)
+
+_QUEUE_LIMIT_FIELDS = (
+    ("max-limit", "upload-max-limit", "download-max-limit"),
+    ("rate", "upload-rate", "download-rate"),
+    ("limit-at", "upload-limit-at", "download-limit-at"),
+    ("burst-limit", "upload-burst-limit", "download-burst-limit"),
+    ("burst-threshold", "upload-burst-threshold", "download-burst-threshold"),
+)
+
+# Keys copied between host rows and their CAPS-MAN/wireless/DHCP/ARP sources
+_HOST_LINK_KEYS = ("mac-address", "interface")
+_HOST_SRC_KEYS = ("address", "mac-address", "interface")
+
+# parse_api specs reused on every poll; parse_api never mutates these
+_INTERFACE_VALS = (
+    {"name": "default-name"},
+    {"name": ".id"},
+    {"name": "name", "default_val": "default-name"},
+    {"name": "type", "default": "unknown"},
+    {"name": "running", "type": "bool"},
+    {
+        "name": "enabled",
+        "source": "disabled",
+        "type": "bool",
+        "reverse": True,
+    },
+    {"name": "port-mac-address", "source": "mac-address"},
+    {"name": "comment"},
+    {"name": "last-link-down-time"},
+    {"name": "last-link-up-time"},
+    {"name": "link-downs"},
+    {"name": "tx-queue-drop"},
+    {"name": "actual-mtu"},
+    {"name": "about", "source": ".about", "default": ""},
+    {"name": "rx-current", "source": "rx-byte", "default": 0.0},
+    {"name": "tx-current", "source": "tx-byte", "default": 0.0},
+)
+
+_INTERFACE_ENSURE_VALS = (
+    {"name": "client-ip-address"},
+    {"name": "client-mac-address"},
+    {"name": "rx-previous", "default": 0.0},
+    {"name": "tx-previous", "default": 0.0},
+    {"name": "rx", "default": 0.0},
+    {"name": "tx", "default": 0.0},
+    {"name": "rx-total", "default": 0.0},
+    {"name": "tx-total", "default": 0.0},
+)
+
+_INTERFACE_SKIP = (
+    {"name": "type", "value": "bridge"},
+    {"name": "type", "value": "ppp-in"},
+    {"name": "type", "value": "pptp-in"},
+    {"name": "type", "value": "sstp-in"},
+    {"name": "type", "value": "l2tp-in"},
+    {"name": "type", "value": "pppoe-in"},
+    {"name": "type", "value": "ovpn-in"},
+)
+
+_NAT_VALS = (
+    {"name": ".id"},
+    {"name": "chain", "default": "unknown"},
+    {"name": "action", "default": "unknown"},
+    {"name": "protocol", "default": "any"},
+    {"name": "dst-port", "default": "any"},
+    {"name": "in-interface", "default": "any"},
+    {"name": "out-interface", "default": "any"},
+    {"name": "to-addresses"},
+    {"name": "to-ports", "default": "any"},
+    {"name": "comment"},
+    {
+        "name": "enabled",
+        "source": "disabled",
+        "type": "bool",
+        "reverse": True,
+    },
+)
+
+_NAT_VAL_PROC = (
+    (
+        {"name": "uniq-id"},
+        {"action": "combine"},
+        {"key": "chain"},
+        {"text": ","},
+        {"key": "action"},
+        {"text": ","},
+        {"key": "protocol"},
+        {"text": ","},
+        {"key": "in-interface"},
+        {"text": ":"},
+        {"key": "dst-port"},
+        {"text": "-"},
+        {"key": "out-interface"},
+        {"text": ":"},
+        {"key": "to-addresses"},
+        {"text": ":"},
+        {"key": "to-ports"},
+    ),
+    (
+        {"name": "name"},
+        {"action": "combine"},
+        {"key": "protocol"},
+        {"text": ":"},
+        {"key": "dst-port"},
+    ),
+)
+
+_QUEUE_VALS = (
+    {"name": ".id"},
+    {"name": "name", "default": "unknown"},
+    {"name": "target", "default": "unknown"},
+    {"name": "rate", "default": "0/0"},
+    {"name": "max-limit", "default": "0/0"},
+    {"name": "limit-at", "default": "0/0"},
+    {"name": "burst-limit", "default": "0/0"},
+    {"name": "burst-threshold", "default": "0/0"},
+    {"name": "burst-time", "default": "0s/0s"},
+    {"name": "packet-marks", "default": "none"},
+    {"name": "parent", "default": "none"},
+    {"name": "comment"},
+    {
+        "name": "enabled",
+        "source": "disabled",
+        "type": "bool",
+        "reverse": True,
+    },
+)
+
+_ROUTERBOARD_VALS = (
+    {"name": "routerboard", "type": "bool"},
+    {"name": "model", "default": "unknown"},
+    {"name": "serial-number", "default": "unknown"},
+    {"name": "current-firmware", "default": "unknown"},
+    {"name": "upgrade-firmware", "default": "unknown"},
+)
+
+_RESOURCE_VALS = (
+    {"name": "platform", "default": "unknown"},
+    {"name": "board-name", "default": "unknown"},
+    {"name": "version", "default": "unknown"},
+    {"name": "uptime_str", "source": "uptime", "default": "unknown"},
+    {"name": "cpu-load", "default": "unknown"},
+    {"name": "free-memory", "default": 0},
+    {"name": "total-memory", "default": 0},
+    {"name": "free-hdd-space", "default": 0},
+    {"name": "total-hdd-space", "default": 0},
+)
+
+_FW_UPDATE_VALS = (
+    {"name": "status"},
+    {"name": "channel", "default": "unknown"},
+    {"name": "installed-version", "default": "unknown"},
+    {"name": "latest-version", "default": "unknown"},
+)
+
+_SCRIPT_VALS = (
+    {"name": "name"},
+    {"name": "last-started", "default": "unknown"},
+    {"name": "run-count", "default": "unknown"},
+)
+
+_ARP_VALS = (
+    {"name": "mac-address"},
+    {"name": "address"},
+    {"name": "interface"},
+)
+
+_DNS_VALS = (
+    {"name": "name"},
+    {"name": "address"},
+    {"name": "comment"},
+)
+
+_DHCP_VALS = (
+    {"name": "mac-address"},
+    {"name": "active-mac-address", "default": "unknown"},
+    {"name": "address", "default": "unknown"},
+    {"name": "active-address", "default": "unknown"},
+    {"name": "host-name", "default": "unknown"},
+    {"name": "status", "default": "unknown"},
+    {"name": "last-seen", "default": "unknown"},
+    {"name": "server", "default": "unknown"},
+    {"name": "comment", "default": ""},
+    {
+        "name": "enabled",
+        "source": "disabled",
+        "type": "bool",
+        "reverse": True,
+    },
+)
+
 
 def is_valid_ip(address):
     try:
@@ -80,6 +285,12 @@ def is_valid_ip(address):
         return False
 
 
+@lru_cache(maxsize=256)
+def _parse_ip_address(address):
+    """Parse an IP address string, caching repeat lookups."""
+    return ip_address(address)
+
+
 def utc_from_timestamp(timestamp: float) -> datetime:
     """Return a UTC time from a timestamp."""
     return pytz.utc.localize(datetime.utcfromtimestamp(timestamp))
@@ -124,6 +335,9 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         self.name = config_entry.data[CONF_NAME]
         self.host = config_entry.data[CONF_HOST]
 
+        # DeviceInfo objects served to the registry, built once per device
+        self.device_info_cache = {}
+
         self.api = MikrotikAPI(
             config_entry.data[CONF_HOST],
             config_entry.data[CONF_USERNAME],
@@ -152,51 +366,37 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
             return
 
         for uid in list(self.coordinator.ds["host"]):
+            vals = self.coordinator.ds["host"][uid]
             if not self.coordinator.host_tracking_initialized:
                 # Add missing default values
-                for key, default in zip(
-                    [
-                        "address",
-                        "mac-address",
-                        "interface",
-                        "host-name",
-                        "last-seen",
-                        "available",
-                    ],
-                    ["unknown", "unknown", "unknown", "unknown", False, False],
-                ):
-                    if key not in self.coordinator.ds["host"][uid]:
-                        self.coordinator.ds["host"][uid][key] = default
+                for key, default in _HOST_DEFAULTS:
+                    if key not in vals:
+                        vals[key] = default
 
             # Check host availability
             if (
-                self.coordinator.ds["host"][uid]["source"]
-                not in ["capsman", "wireless"]
-                and self.coordinator.ds["host"][uid]["address"] not in ["unknown", ""]
-                and self.coordinator.ds["host"][uid]["interface"] not in ["unknown", ""]
+                vals["source"] not in ["capsman", "wireless"]
+                and vals["address"] not in ["unknown", ""]
+                and vals["interface"] not in ["unknown", ""]
             ):
-                tmp_interface = self.coordinator.ds["host"][uid]["interface"]
+                tmp_interface = vals["interface"]
                 if (
                     uid in self.coordinator.ds["arp"]
                     and self.coordinator.ds["arp"][uid]["bridge"] != ""
                 ):
                     tmp_interface = self.coordinator.ds["arp"][uid]["bridge"]
 
-                _LOGGER.debug(
-                    "Ping host: %s", self.coordinator.ds["host"][uid]["address"]
-                )
+                _LOGGER.debug("Ping host: %s", vals["address"])
 
-                self.coordinator.ds["host"][uid][
-                    "available"
-                ] = await self.hass.async_add_executor_job(
+                vals["available"] = await self.hass.async_add_executor_job(
                     self.api.arp_ping,
-                    self.coordinator.ds["host"][uid]["address"],
+                    vals["address"],
                     tmp_interface,
                 )
 
             # Update last seen
-            if self.coordinator.ds["host"][uid]["available"]:
-                self.coordinator.ds["host"][uid]["last-seen"] = utcnow()
+            if vals["available"]:
+                vals["last-seen"] = utcnow()
 
         self.coordinator.host_tracking_initialized = True
 
@@ -217,6 +417,55 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Initialize MikrotikCoordinator."""
         self.hass = hass
         self.config_entry: ConfigEntry = config_entry
+
+        # Options are read on every poll; cache the resolved values.
+        # An options change reloads the entry and rebuilds the coordinator.
+        self._option_scan_interval = timedelta(
+            seconds=config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self._option_track_iface_clients = config_entry.options.get(
+            CONF_TRACK_IFACE_CLIENTS, DEFAULT_TRACK_IFACE_CLIENTS
+        )
+        self._option_track_network_hosts = config_entry.options.get(
+            CONF_TRACK_HOSTS, DEFAULT_TRACK_HOSTS
+        )
+        self._option_sensor_port_traffic = config_entry.options.get(
+            CONF_SENSOR_PORT_TRAFFIC, DEFAULT_SENSOR_PORT_TRAFFIC
+        )
+        self._option_sensor_client_traffic = config_entry.options.get(
+            CONF_SENSOR_CLIENT_TRAFFIC, DEFAULT_SENSOR_CLIENT_TRAFFIC
+        )
+        self._option_sensor_client_captive = config_entry.options.get(
+            CONF_SENSOR_CLIENT_CAPTIVE, DEFAULT_SENSOR_CLIENT_CAPTIVE
+        )
+        self._option_sensor_simple_queues = config_entry.options.get(
+            CONF_SENSOR_SIMPLE_QUEUES, DEFAULT_SENSOR_SIMPLE_QUEUES
+        )
+        self._option_sensor_nat = config_entry.options.get(
+            CONF_SENSOR_NAT, DEFAULT_SENSOR_NAT
+        )
+        self._option_sensor_mangle = config_entry.options.get(
+            CONF_SENSOR_MANGLE, DEFAULT_SENSOR_MANGLE
+        )
+        self._option_sensor_filter = config_entry.options.get(
+            CONF_SENSOR_FILTER, DEFAULT_SENSOR_FILTER
+        )
+        self._option_sensor_kidcontrol = config_entry.options.get(
+            CONF_SENSOR_KIDCONTROL, DEFAULT_SENSOR_KIDCONTROL
+        )
+        self._option_sensor_netwatch = config_entry.options.get(
+            CONF_SENSOR_NETWATCH_TRACKER, DEFAULT_SENSOR_NETWATCH_TRACKER
+        )
+        self._option_sensor_ppp = config_entry.options.get(
+            CONF_SENSOR_PPP, DEFAULT_SENSOR_PPP
+        )
+        self._option_sensor_scripts = config_entry.options.get(
+            CONF_SENSOR_SCRIPTS, DEFAULT_SENSOR_SCRIPTS
+        )
+        self._option_sensor_environment = config_entry.options.get(
+            CONF_SENSOR_ENVIRONMENT, DEFAULT_SENSOR_ENVIRONMENT
+        )
+
         super().__init__(
             self.hass,
             _LOGGER,
@@ -265,6 +514,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         self.notified_flags = []
 
+        # DeviceInfo objects served to the registry, built once per device
+        self.device_info_cache = {}
+
         self.api = MikrotikAPI(
             config_entry.data[CONF_HOST],
             config_entry.data[CONF_USERNAME],
@@ -273,13 +525,16 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             config_entry.data[CONF_SSL],
         )
 
-        self.debug = False
-        if _LOGGER.getEffectiveLevel() == 10:
-            self.debug = True
+        self.debug = _LOGGER.getEffectiveLevel() == 10
 
         self.nat_removed = {}
         self.mangle_removed = {}
         self.filter_removed = {}
+        # uniq-id -> .id lookups for the rule switches
+        self.nat_index = {}
+        self.mangle_index = {}
+        self.filter_index = {}
+        self._iface_uid_by_name = {}
         self.host_hass_recovered = False
         self.host_tracking_initialized = False
 
@@ -298,15 +553,40 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         self.last_hwinfo_update = datetime(1970, 1, 1)
 
+        self._update_lock = asyncio.Lock()
+
+        # Coalesce per-poll entity discovery notifications into one dispatch
+        self._update_sensors_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=True,
+            function=self._async_send_update_sensors,
+        )
+
+    # ---------------------------
+    #   async_shutdown
+    # ---------------------------
+    async def async_shutdown(self) -> None:
+        """Cancel any pending dispatch when the coordinator stops."""
+        self._update_sensors_debouncer.async_cancel()
+        await super().async_shutdown()
+
+    # ---------------------------
+    #   _async_send_update_sensors
+    # ---------------------------
+    @callback
+    def _async_send_update_sensors(self) -> None:
+        """Notify platforms so entities for new rows get added."""
+        async_dispatcher_send(self.hass, "update_sensors")
+
     # ---------------------------
     #   option_track_iface_clients
     # ---------------------------
     @property
     def option_track_iface_clients(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_TRACK_IFACE_CLIENTS, DEFAULT_TRACK_IFACE_CLIENTS
-        )
+        return self._option_track_iface_clients
 
     # ---------------------------
     #   option_track_network_hosts
@@ -314,7 +594,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_track_network_hosts(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(CONF_TRACK_HOSTS, DEFAULT_TRACK_HOSTS)
+        return self._option_track_network_hosts
 
     # ---------------------------
     #   option_sensor_port_traffic
@@ -322,9 +602,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_port_traffic(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_PORT_TRAFFIC, DEFAULT_SENSOR_PORT_TRAFFIC
-        )
+        return self._option_sensor_port_traffic
 
     # ---------------------------
     #   option_sensor_client_traffic
@@ -332,9 +610,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_client_traffic(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_CLIENT_TRAFFIC, DEFAULT_SENSOR_CLIENT_TRAFFIC
-        )
+        return self._option_sensor_client_traffic
 
     # ---------------------------
     #   option_sensor_client_captive
@@ -342,9 +618,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_client_captive(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_CLIENT_CAPTIVE, DEFAULT_SENSOR_CLIENT_CAPTIVE
-        )
+        return self._option_sensor_client_captive
 
     # ---------------------------
     #   option_sensor_simple_queues
@@ -352,9 +626,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_simple_queues(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_SIMPLE_QUEUES, DEFAULT_SENSOR_SIMPLE_QUEUES
-        )
+        return self._option_sensor_simple_queues
 
     # ---------------------------
     #   option_sensor_nat
@@ -362,7 +634,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_nat(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(CONF_SENSOR_NAT, DEFAULT_SENSOR_NAT)
+        return self._option_sensor_nat
 
     # ---------------------------
     #   option_sensor_mangle
@@ -370,7 +642,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_mangle(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(CONF_SENSOR_MANGLE, DEFAULT_SENSOR_MANGLE)
+        return self._option_sensor_mangle
 
     # ---------------------------
     #   option_sensor_filter
@@ -378,7 +650,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_filter(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(CONF_SENSOR_FILTER, DEFAULT_SENSOR_FILTER)
+        return self._option_sensor_filter
 
     # ---------------------------
     #   option_sensor_kidcontrol
@@ -386,9 +658,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_kidcontrol(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_KIDCONTROL, DEFAULT_SENSOR_KIDCONTROL
-        )
+        return self._option_sensor_kidcontrol
 
     # ---------------------------
     #   option_sensor_netwatch
@@ -396,9 +666,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_netwatch(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_NETWATCH_TRACKER, DEFAULT_SENSOR_NETWATCH_TRACKER
-        )
+        return self._option_sensor_netwatch
 
     # ---------------------------
     #   option_sensor_ppp
@@ -406,7 +674,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_ppp(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(CONF_SENSOR_PPP, DEFAULT_SENSOR_PPP)
+        return self._option_sensor_ppp
 
     # ---------------------------
     #   option_sensor_scripts
@@ -414,9 +682,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_scripts(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_SCRIPTS, DEFAULT_SENSOR_SCRIPTS
-        )
+        return self._option_sensor_scripts
 
     # ---------------------------
     #   option_sensor_environment
@@ -424,9 +690,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_sensor_environment(self):
         """Config entry option to not track ARP."""
-        return self.config_entry.options.get(
-            CONF_SENSOR_ENVIRONMENT, DEFAULT_SENSOR_ENVIRONMENT
-        )
+        return self._option_sensor_environment
 
     # ---------------------------
     #   option_scan_interval
@@ -434,10 +698,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     @property
     def option_scan_interval(self):
         """Config entry option scan interval."""
-        scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
-        return timedelta(seconds=scan_interval)
+        return self._option_scan_interval
 
     # ---------------------------
     #   connected
@@ -538,7 +799,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 
             else:
                 self.support_capsman = True
-                self.support_wireless = bool(self.minor_fw_version < 13)
+                self.support_wireless = self.minor_fw_version < 13
                 
             _LOGGER.debug("Mikrotik %s wifi module=%s",
                     self.host,
@@ -578,48 +839,41 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     #   _async_update_data
     # ---------------------------
     async def _async_update_data(self):
-        """Update Mikrotik data"""
-        delta = datetime.now().replace(microsecond=0) - self.last_hwinfo_update
-        if self.api.has_reconnected() or delta.total_seconds() > 60 * 60 * 4:
-            await self.hass.async_add_executor_job(self.get_access)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_firmware_update)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_resource)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_capabilities)
-
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_system_routerboard)
+        """Trigger update by timer"""
+        if self._update_lock.locked():
+            # A previous poll is still running, do not pile a second one on
+            return self.ds
 
-            if self.api.connected() and self.option_sensor_scripts:
-                await self.hass.async_add_executor_job(self.get_script)
+        async with self._update_lock:
+            return await self._async_update_mikrotik_data()
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dhcp_network)
+    # ---------------------------
+    #   _async_update_mikrotik_data
+    # ---------------------------
+    async def _async_update_mikrotik_data(self):
+        """Update Mikrotik data"""
+        await self.hass.async_add_executor_job(self.get_system_resource)
 
-            if self.api.connected():
-                await self.hass.async_add_executor_job(self.get_dns)
+        delta = datetime.now().replace(microsecond=0) - self.last_hwinfo_update
+        if (
+            self.api.has_reconnected()
+            or delta.total_seconds() > HWINFO_REFRESH_INTERVAL
+        ):
+            await self.hass.async_add_executor_job(self._fetch_hwinfo_sync)
 
             if not self.api.connected():
                 raise UpdateFailed("Mikrotik Disconnected")
 
-            if self.api.connected():
-                self.last_hwinfo_update = datetime.now().replace(microsecond=0)
-
-        await self.hass.async_add_executor_job(self.get_system_resource)
-
-        # if self.api.connected() and "available" not in self.ds["fw-update"]:
-        #     await self.hass.async_add_executor_job(self.get_firmware_update)
+            self.last_hwinfo_update = datetime.now().replace(microsecond=0)
 
+        # Health, DHCP client and bridge host data do not depend on each
+        # other or on the interface data, fetch them concurrently
         if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_system_health)
-
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp_client)
+            await asyncio.gather(
+                self.hass.async_add_executor_job(self.get_system_health),
+                self.hass.async_add_executor_job(self.get_dhcp_client),
+                self.hass.async_add_executor_job(self.get_bridge),
+            )
 
         if self.api.connected():
             await self.hass.async_add_executor_job(self.get_interface)
@@ -627,75 +881,124 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         if self.api.connected() and not self.ds["host_hass"]:
             await self.async_get_host_hass()
 
-        if self.api.connected() and self.support_capsman:
-            await self.hass.async_add_executor_job(self.get_capsman_hosts)
-
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless)
-
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless_hosts)
+        # The wireless tables only feed into already-fetched interface rows
+        jobs = []
+        if self.support_capsman:
+            jobs.append(self.get_capsman_hosts)
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_bridge)
+        if self.support_wireless:
+            jobs.append(self.get_wireless)
+            jobs.append(self.get_wireless_hosts)
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_arp)
+        if self.api.connected() and jobs:
+            await asyncio.gather(
+                *(self.hass.async_add_executor_job(job) for job in jobs)
+            )
 
         if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp)
+            await self.hass.async_add_executor_job(self._fetch_linked_sync)
 
         if self.api.connected():
             await self.async_process_host()
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.process_interface_client)
-
-        if self.api.connected() and self.option_sensor_nat:
-            await self.hass.async_add_executor_job(self.get_nat)
+        # These fetches are independent of each other, fan them out
+        jobs = []
+        if self.option_sensor_nat:
+            jobs.append(self.get_nat)
 
-        if self.api.connected() and self.option_sensor_kidcontrol:
-            await self.hass.async_add_executor_job(self.get_kidcontrol)
+        if self.option_sensor_kidcontrol:
+            jobs.append(self.get_kidcontrol)
 
-        if self.api.connected() and self.option_sensor_mangle:
-            await self.hass.async_add_executor_job(self.get_mangle)
+        if self.option_sensor_mangle:
+            jobs.append(self.get_mangle)
 
-        if self.api.connected() and self.option_sensor_filter:
-            await self.hass.async_add_executor_job(self.get_filter)
+        if self.option_sensor_filter:
+            jobs.append(self.get_filter)
 
-        if self.api.connected() and self.option_sensor_netwatch:
-            await self.hass.async_add_executor_job(self.get_netwatch)
+        if self.option_sensor_netwatch:
+            jobs.append(self.get_netwatch)
 
-        if self.api.connected() and self.support_ppp and self.option_sensor_ppp:
-            await self.hass.async_add_executor_job(self.get_ppp)
+        if self.support_ppp and self.option_sensor_ppp:
+            jobs.append(self.get_ppp)
 
-        if self.api.connected() and self.option_sensor_client_traffic:
+        if self.option_sensor_client_traffic:
             if 0 < self.major_fw_version < 7:
-                await self.hass.async_add_executor_job(self.process_accounting)
+                jobs.append(self.process_accounting)
             elif 0 < self.major_fw_version >= 7:
-                await self.hass.async_add_executor_job(self.process_kid_control_devices)
+                jobs.append(self.process_kid_control_devices)
+
+        if self.option_sensor_client_captive:
+            jobs.append(self.get_captive)
 
-        if self.api.connected() and self.option_sensor_client_captive:
-            await self.hass.async_add_executor_job(self.get_captive)
+        if self.option_sensor_simple_queues:
+            jobs.append(self.get_queue)
 
-        if self.api.connected() and self.option_sensor_simple_queues:
-            await self.hass.async_add_executor_job(self.get_queue)
+        if self.option_sensor_environment:
+            jobs.append(self.get_environment)
 
-        if self.api.connected() and self.option_sensor_environment:
-            await self.hass.async_add_executor_job(self.get_environment)
+        if self.support_ups:
+            jobs.append(self.get_ups)
 
-        if self.api.connected() and self.support_ups:
-            await self.hass.async_add_executor_job(self.get_ups)
+        if self.support_gps:
+            jobs.append(self.get_gps)
 
-        if self.api.connected() and self.support_gps:
-            await self.hass.async_add_executor_job(self.get_gps)
+        if self.api.connected() and jobs:
+            await asyncio.gather(
+                *(self.hass.async_add_executor_job(job) for job in jobs)
+            )
 
         if not self.api.connected():
             raise UpdateFailed("Mikrotik Disconnected")
 
-        # async_dispatcher_send(self.hass, "update_sensors", self)
+        await self._update_sensors_debouncer.async_call()
         return self.ds
 
+    # ---------------------------
+    #   _fetch_hwinfo_sync
+    # ---------------------------
+    def _fetch_hwinfo_sync(self) -> None:
+        """Fetch the rarely-changing info in a single executor job."""
+        self.get_access()
+
+        if self.api.connected():
+            self.get_firmware_update()
+
+        if self.api.connected():
+            self.get_capabilities()
+
+        if self.api.connected():
+            self.get_system_routerboard()
+
+        if self.api.connected() and self.option_sensor_scripts:
+            self.get_script()
+
+        if self.api.connected():
+            self.get_dhcp_network()
+
+        if self.api.connected():
+            self.get_dns()
+
+    # ---------------------------
+    #   _fetch_linked_sync
+    # ---------------------------
+    def _fetch_linked_sync(self) -> None:
+        """Run the interdependent ARP/DHCP fetches in a single executor job."""
+        # ARP rows feed interface client tracking, network host tracking
+        # and the host merge behind client traffic accounting; skip the
+        # fetch only when none of those consumers are enabled
+        if (
+            self.option_track_iface_clients
+            or self.option_track_network_hosts
+            or self.option_sensor_client_traffic
+        ):
+            self.get_arp()
+
+        if self.api.connected():
+            self.get_dhcp()
+
+        if self.api.connected():
+            self.process_interface_client()
+
     # ---------------------------
     #   get_access
     # ---------------------------
@@ -749,72 +1052,30 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             source=self.api.query("/interface"),
             key="default-name",
             key_secondary="name",
-            vals=[
-                {"name": "default-name"},
-                {"name": ".id"},
-                {"name": "name", "default_val": "default-name"},
-                {"name": "type", "default": "unknown"},
-                {"name": "running", "type": "bool"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-                {"name": "port-mac-address", "source": "mac-address"},
-                {"name": "comment"},
-                {"name": "last-link-down-time"},
-                {"name": "last-link-up-time"},
-                {"name": "link-downs"},
-                {"name": "tx-queue-drop"},
-                {"name": "actual-mtu"},
-                {"name": "about", "source": ".about", "default": ""},
-                {"name": "rx-current", "source": "rx-byte", "default": 0.0},
-                {"name": "tx-current", "source": "tx-byte", "default": 0.0},
-            ],
-            ensure_vals=[
-                {"name": "client-ip-address"},
-                {"name": "client-mac-address"},
-                {"name": "rx-previous", "default": 0.0},
-                {"name": "tx-previous", "default": 0.0},
-                {"name": "rx", "default": 0.0},
-                {"name": "tx", "default": 0.0},
-                {"name": "rx-total", "default": 0.0},
-                {"name": "tx-total", "default": 0.0},
-            ],
-            skip=[
-                {"name": "type", "value": "bridge"},
-                {"name": "type", "value": "ppp-in"},
-                {"name": "type", "value": "pptp-in"},
-                {"name": "type", "value": "sstp-in"},
-                {"name": "type", "value": "l2tp-in"},
-                {"name": "type", "value": "pppoe-in"},
-                {"name": "type", "value": "ovpn-in"},
-            ],
+            vals=_INTERFACE_VALS,
+            ensure_vals=_INTERFACE_ENSURE_VALS,
+            skip=_INTERFACE_SKIP,
         )
 
         if self.option_sensor_port_traffic:
-            for uid, vals in self.ds["interface"].items():
+            scan_interval = self.option_scan_interval.seconds
+            for vals in self.ds["interface"].values():
                 current_tx = vals["tx-current"]
                 previous_tx = vals["tx-previous"] or current_tx
 
                 delta_tx = max(0, current_tx - previous_tx)
-                self.ds["interface"][uid]["tx"] = round(
-                    delta_tx / self.option_scan_interval.seconds
-                )
-                self.ds["interface"][uid]["tx-previous"] = current_tx
+                vals["tx"] = round(delta_tx / scan_interval)
+                vals["tx-previous"] = current_tx
 
                 current_rx = vals["rx-current"]
                 previous_rx = vals["rx-previous"] or current_rx
 
                 delta_rx = max(0, current_rx - previous_rx)
-                self.ds["interface"][uid]["rx"] = round(
-                    delta_rx / self.option_scan_interval.seconds
-                )
-                self.ds["interface"][uid]["rx-previous"] = current_rx
+                vals["rx"] = round(delta_rx / scan_interval)
+                vals["rx-previous"] = current_rx
 
-                self.ds["interface"][uid]["tx-total"] = current_tx
-                self.ds["interface"][uid]["rx-total"] = current_rx
+                vals["tx-total"] = current_tx
+                vals["rx-total"] = current_rx
 
         self.ds["interface"] = parse_api(
             data=self.ds["interface"],
@@ -840,17 +1101,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         # Udpate virtual interfaces
         for uid, vals in self.ds["interface"].items():
-            self.ds["interface"][uid]["comment"] = str(
-                self.ds["interface"][uid]["comment"]
-            )
+            vals["comment"] = str(vals["comment"])
 
             if vals["default-name"] == "":
-                self.ds["interface"][uid]["default-name"] = vals["name"]
-                self.ds["interface"][uid][
-                    "port-mac-address"
-                ] = f"{vals['port-mac-address']}-{vals['name']}"
+                vals["default-name"] = vals["name"]
+                vals["port-mac-address"] = f"{vals['port-mac-address']}-{vals['name']}"
 
-            if self.ds["interface"][uid]["type"] == "ether":
+            if vals["type"] == "ether":
                 if (
                     "sfp-shutdown-temperature" in vals
                     and vals["sfp-shutdown-temperature"] != ""
@@ -903,6 +1160,12 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                         ],
                     )
 
+        # Rebuild in place instead of allocating a fresh dict every poll
+        self._iface_uid_by_name.clear()
+        self._iface_uid_by_name.update(
+            (vals["name"], uid) for uid, vals in self.ds["interface"].items()
+        )
+
     # ---------------------------
     #   get_bridge
     # ---------------------------
@@ -910,7 +1173,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get system resources data from Mikrotik"""
         self.ds["bridge_host"] = parse_api(
             data=self.ds["bridge_host"],
-            source=self.api.query("/interface/bridge/host"),
+            source=self.api.query(
+                "/interface/bridge/host",
+                proplist=("mac-address", "interface", "bridge", "disabled", "local"),
+            ),
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -935,35 +1201,37 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     def process_interface_client(self) -> None:
         # Remove data if disabled
         if not self.option_track_iface_clients:
-            for uid in self.ds["interface"]:
-                self.ds["interface"][uid]["client-ip-address"] = "disabled"
-                self.ds["interface"][uid]["client-mac-address"] = "disabled"
+            for vals in self.ds["interface"].values():
+                vals["client-ip-address"] = "disabled"
+                vals["client-mac-address"] = "disabled"
             return
 
-        for uid, vals in self.ds["interface"].items():
-            self.ds["interface"][uid]["client-ip-address"] = ""
-            self.ds["interface"][uid]["client-mac-address"] = ""
-            for arp_uid, arp_vals in self.ds["arp"].items():
-                if arp_vals["interface"] != vals["name"]:
-                    continue
+        ifaces = self.ds["interface"]
+        for vals in ifaces.values():
+            vals["client-ip-address"] = ""
+            vals["client-mac-address"] = ""
 
-                if self.ds["interface"][uid]["client-ip-address"] == "":
-                    self.ds["interface"][uid]["client-ip-address"] = arp_vals["address"]
-                else:
-                    self.ds["interface"][uid]["client-ip-address"] = "multiple"
+        for arp_vals in self.ds["arp"].values():
+            uid = self._iface_uid_by_name.get(arp_vals["interface"])
+            if uid is None:
+                continue
 
-                if self.ds["interface"][uid]["client-mac-address"] == "":
-                    self.ds["interface"][uid]["client-mac-address"] = arp_vals[
-                        "mac-address"
-                    ]
-                else:
-                    self.ds["interface"][uid]["client-mac-address"] = "multiple"
+            vals = ifaces[uid]
+            vals["client-ip-address"] = (
+                arp_vals["address"] if vals["client-ip-address"] == "" else "multiple"
+            )
+            vals["client-mac-address"] = (
+                arp_vals["mac-address"]
+                if vals["client-mac-address"] == ""
+                else "multiple"
+            )
 
-            if self.ds["interface"][uid]["client-ip-address"] == "":
-                self.ds["interface"][uid]["client-ip-address"] = "none"
+        for vals in ifaces.values():
+            if vals["client-ip-address"] == "":
+                vals["client-ip-address"] = "none"
 
-            if self.ds["interface"][uid]["client-mac-address"] == "":
-                self.ds["interface"][uid]["client-mac-address"] = "none"
+            if vals["client-mac-address"] == "":
+                vals["client-mac-address"] = "none"
 
     # ---------------------------
     #   get_nat
@@ -972,81 +1240,59 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get NAT data from Mikrotik"""
         self.ds["nat"] = parse_api(
             data=self.ds["nat"],
-            source=self.api.query("/ip/firewall/nat"),
+            source=self.api.query(
+                "/ip/firewall/nat",
+                proplist=(
+                    ".id",
+                    "chain",
+                    "action",
+                    "protocol",
+                    "dst-port",
+                    "in-interface",
+                    "out-interface",
+                    "to-addresses",
+                    "to-ports",
+                    "comment",
+                    "disabled",
+                ),
+                where={"action": "dst-nat"},
+            ),
             key=".id",
-            vals=[
-                {"name": ".id"},
-                {"name": "chain", "default": "unknown"},
-                {"name": "action", "default": "unknown"},
-                {"name": "protocol", "default": "any"},
-                {"name": "dst-port", "default": "any"},
-                {"name": "in-interface", "default": "any"},
-                {"name": "out-interface", "default": "any"},
-                {"name": "to-addresses"},
-                {"name": "to-ports", "default": "any"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
-            val_proc=[
-                [
-                    {"name": "uniq-id"},
-                    {"action": "combine"},
-                    {"key": "chain"},
-                    {"text": ","},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ","},
-                    {"key": "in-interface"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                    {"text": "-"},
-                    {"key": "out-interface"},
-                    {"text": ":"},
-                    {"key": "to-addresses"},
-                    {"text": ":"},
-                    {"key": "to-ports"},
-                ],
-                [
-                    {"name": "name"},
-                    {"action": "combine"},
-                    {"key": "protocol"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-            ],
+            vals=_NAT_VALS,
+            val_proc=_NAT_VAL_PROC,
             only=[{"key": "action", "value": "dst-nat"}],
         )
 
         # Remove duplicate NAT entries to prevent crash
         nat_uniq = {}
-        nat_del = {}
-        for uid in self.ds["nat"]:
-            self.ds["nat"][uid]["comment"] = str(self.ds["nat"][uid]["comment"])
+        nat_del = set()
+        for uid, vals in self.ds["nat"].items():
+            vals["comment"] = str(vals["comment"])
 
-            tmp_name = self.ds["nat"][uid]["uniq-id"]
-            if tmp_name not in nat_uniq:
+            tmp_name = vals["uniq-id"]
+            other = nat_uniq.get(tmp_name)
+            if other is None:
                 nat_uniq[tmp_name] = uid
             else:
-                nat_del[uid] = 1
-                nat_del[nat_uniq[tmp_name]] = 1
+                nat_del.add(uid)
+                nat_del.add(other)
 
         for uid in nat_del:
-            if self.ds["nat"][uid]["uniq-id"] not in self.nat_removed:
-                self.nat_removed[self.ds["nat"][uid]["uniq-id"]] = 1
+            vals = self.ds["nat"][uid]
+            if vals["uniq-id"] not in self.nat_removed:
+                self.nat_removed[vals["uniq-id"]] = 1
                 _LOGGER.error(
                     "Mikrotik %s duplicate NAT rule %s, entity will be unavailable.",
                     self.host,
-                    self.ds["nat"][uid]["name"],
+                    vals["name"],
                 )
 
             del self.ds["nat"][uid]
 
+        self.nat_index = {
+            vals["uniq-id"]: vals[".id"] for vals in self.ds["nat"].values()
+        }
+
     # ---------------------------
     #   get_mangle
     # ---------------------------
@@ -1054,7 +1300,26 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get Mangle data from Mikrotik"""
         self.ds["mangle"] = parse_api(
             data=self.ds["mangle"],
-            source=self.api.query("/ip/firewall/mangle"),
+            source=self.api.query(
+                "/ip/firewall/mangle",
+                proplist=(
+                    ".id",
+                    "chain",
+                    "action",
+                    "comment",
+                    "address-list",
+                    "passthrough",
+                    "protocol",
+                    "src-address",
+                    "src-port",
+                    "dst-address",
+                    "dst-port",
+                    "src-address-list",
+                    "dst-address-list",
+                    "disabled",
+                    "dynamic",
+                ),
+            ),
             key=".id",
             vals=[
                 {"name": ".id"},
@@ -1139,6 +1404,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
             del self.ds["mangle"][uid]
 
+        self.mangle_index = {
+            vals["uniq-id"]: vals[".id"] for vals in self.ds["mangle"].values()
+        }
+
     # ---------------------------
     #   get_filter
     # ---------------------------
@@ -1146,7 +1415,32 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get Filter data from Mikrotik"""
         self.ds["filter"] = parse_api(
             data=self.ds["filter"],
-            source=self.api.query("/ip/firewall/filter"),
+            source=self.api.query(
+                "/ip/firewall/filter",
+                proplist=(
+                    ".id",
+                    "chain",
+                    "action",
+                    "comment",
+                    "address-list",
+                    "protocol",
+                    "in-interface",
+                    "in-interface-list",
+                    "out-interface",
+                    "out-interface-list",
+                    "src-address",
+                    "src-address-list",
+                    "src-port",
+                    "dst-address",
+                    "dst-address-list",
+                    "dst-port",
+                    "layer7-protocol",
+                    "connection-state",
+                    "tcp-flags",
+                    "disabled",
+                    "dynamic",
+                ),
+            ),
             key=".id",
             vals=[
                 {"name": ".id"},
@@ -1249,6 +1543,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
             del self.ds["filter"][uid]
 
+        self.filter_index = {
+            vals["uniq-id"]: vals[".id"] for vals in self.ds["filter"].values()
+        }
+
     # ---------------------------
     #   get_kidcontrol
     # ---------------------------
@@ -1256,7 +1554,24 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get Kid-control data from Mikrotik"""
         self.ds["kid-control"] = parse_api(
             data=self.ds["kid-control"],
-            source=self.api.query("/ip/kid-control"),
+            source=self.api.query(
+                "/ip/kid-control",
+                proplist=(
+                    "name",
+                    "rate-limit",
+                    "mon",
+                    "tue",
+                    "wed",
+                    "thu",
+                    "fri",
+                    "sat",
+                    "sun",
+                    "comment",
+                    "blocked",
+                    "paused",
+                    "disabled",
+                ),
+            ),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1280,10 +1595,8 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
-        for uid in self.ds["kid-control"]:
-            self.ds["kid-control"][uid]["comment"] = str(
-                self.ds["kid-control"][uid]["comment"]
-            )
+        for vals in self.ds["kid-control"].values():
+            vals["comment"] = str(vals["comment"])
 
     # ---------------------------
     #   get_ppp
@@ -1292,7 +1605,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get PPP data from Mikrotik"""
         self.ds["ppp_secret"] = parse_api(
             data=self.ds["ppp_secret"],
-            source=self.api.query("/ppp/secret"),
+            source=self.api.query(
+                "/ppp/secret",
+                proplist=("name", "service", "profile", "comment", "disabled"),
+            ),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1314,9 +1630,17 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
+        source = self.api.query(
+            "/ppp/active",
+            proplist=("name", "service", "caller-id", "address", "encoding"),
+        )
+        if source is None:
+            # Keep last known data on a failed fetch
+            return
+
         self.ds["ppp_active"] = parse_api(
             data={},
-            source=self.api.query("/ppp/active"),
+            source=source,
             key="name",
             vals=[
                 {"name": "name"},
@@ -1327,27 +1651,20 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
-        for uid in self.ds["ppp_secret"]:
-            self.ds["ppp_secret"][uid]["comment"] = str(
-                self.ds["ppp_secret"][uid]["comment"]
-            )
+        for uid, vals in self.ds["ppp_secret"].items():
+            vals["comment"] = str(vals["comment"])
 
-            if self.ds["ppp_secret"][uid]["name"] in self.ds["ppp_active"]:
-                self.ds["ppp_secret"][uid]["connected"] = True
-                self.ds["ppp_secret"][uid]["caller-id"] = self.ds["ppp_active"][uid][
-                    "caller-id"
-                ]
-                self.ds["ppp_secret"][uid]["address"] = self.ds["ppp_active"][uid][
-                    "address"
-                ]
-                self.ds["ppp_secret"][uid]["encoding"] = self.ds["ppp_active"][uid][
-                    "encoding"
-                ]
+            active_vals = self.ds["ppp_active"].get(vals["name"])
+            if active_vals is not None:
+                vals["connected"] = True
+                vals["caller-id"] = active_vals["caller-id"]
+                vals["address"] = active_vals["address"]
+                vals["encoding"] = active_vals["encoding"]
             else:
-                self.ds["ppp_secret"][uid]["connected"] = False
-                self.ds["ppp_secret"][uid]["caller-id"] = "not connected"
-                self.ds["ppp_secret"][uid]["address"] = "not connected"
-                self.ds["ppp_secret"][uid]["encoding"] = "not connected"
+                vals["connected"] = False
+                vals["caller-id"] = "not connected"
+                vals["address"] = "not connected"
+                vals["encoding"] = "not connected"
 
     # ---------------------------
     #   get_netwatch
@@ -1356,7 +1673,19 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get netwatch data from Mikrotik"""
         self.ds["netwatch"] = parse_api(
             data=self.ds["netwatch"],
-            source=self.api.query("/tool/netwatch"),
+            source=self.api.query(
+                "/tool/netwatch",
+                proplist=(
+                    "host",
+                    "type",
+                    "interval",
+                    "port",
+                    "http-codes",
+                    "status",
+                    "comment",
+                    "disabled",
+                ),
+            ),
             key="host",
             vals=[
                 {"name": "host"},
@@ -1390,13 +1719,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.ds["routerboard"] = parse_api(
                 data=self.ds["routerboard"],
                 source=self.api.query("/system/routerboard"),
-                vals=[
-                    {"name": "routerboard", "type": "bool"},
-                    {"name": "model", "default": "unknown"},
-                    {"name": "serial-number", "default": "unknown"},
-                    {"name": "current-firmware", "default": "unknown"},
-                    {"name": "upgrade-firmware", "default": "unknown"},
-                ],
+                vals=_ROUTERBOARD_VALS,
             )
 
             if (
@@ -1451,24 +1774,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     def get_system_resource(self) -> None:
         """Get system resources data from Mikrotik"""
-        tmp_rebootcheck = 0
-        if "uptime_epoch" in self.ds["resource"]:
-            tmp_rebootcheck = self.ds["resource"]["uptime_epoch"]
+        resource = self.ds["resource"]
+        tmp_rebootcheck = resource.get("uptime_epoch", 0)
 
-        self.ds["resource"] = parse_api(
-            data=self.ds["resource"],
+        self.ds["resource"] = resource = parse_api(
+            data=resource,
             source=self.api.query("/system/resource"),
-            vals=[
-                {"name": "platform", "default": "unknown"},
-                {"name": "board-name", "default": "unknown"},
-                {"name": "version", "default": "unknown"},
-                {"name": "uptime_str", "source": "uptime", "default": "unknown"},
-                {"name": "cpu-load", "default": "unknown"},
-                {"name": "free-memory", "default": 0},
-                {"name": "total-memory", "default": 0},
-                {"name": "free-hdd-space", "default": 0},
-                {"name": "total-hdd-space", "default": 0},
-            ],
+            vals=_RESOURCE_VALS,
             ensure_vals=[
                 {"name": "uptime", "default": 0},
                 {"name": "uptime_epoch", "default": 0},
@@ -1479,67 +1791,67 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
         tmp_uptime = 0
-        tmp = re.split(r"(\d+)[s]", self.ds["resource"]["uptime_str"])
+        tmp = re.split(r"(\d+)[s]", resource["uptime_str"])
         if len(tmp) > 1:
             tmp_uptime += int(tmp[1])
-        tmp = re.split(r"(\d+)[m]", self.ds["resource"]["uptime_str"])
+        tmp = re.split(r"(\d+)[m]", resource["uptime_str"])
         if len(tmp) > 1:
             tmp_uptime += int(tmp[1]) * 60
-        tmp = re.split(r"(\d+)[h]", self.ds["resource"]["uptime_str"])
+        tmp = re.split(r"(\d+)[h]", resource["uptime_str"])
         if len(tmp) > 1:
             tmp_uptime += int(tmp[1]) * 3600
-        tmp = re.split(r"(\d+)[d]", self.ds["resource"]["uptime_str"])
+        tmp = re.split(r"(\d+)[d]", resource["uptime_str"])
         if len(tmp) > 1:
             tmp_uptime += int(tmp[1]) * 86400
-        tmp = re.split(r"(\d+)[w]", self.ds["resource"]["uptime_str"])
+        tmp = re.split(r"(\d+)[w]", resource["uptime_str"])
         if len(tmp) > 1:
             tmp_uptime += int(tmp[1]) * 604800
 
-        self.ds["resource"]["uptime_epoch"] = tmp_uptime
+        resource["uptime_epoch"] = tmp_uptime
         now = datetime.now().replace(microsecond=0)
         uptime_tm = datetime.timestamp(now - timedelta(seconds=tmp_uptime))
         update_uptime = False
-        if not self.ds["resource"]["uptime"]:
+        if not resource["uptime"]:
             update_uptime = True
         else:
-            uptime_old = datetime.timestamp(self.ds["resource"]["uptime"])
+            uptime_old = datetime.timestamp(resource["uptime"])
             if uptime_tm > uptime_old + 10:
                 update_uptime = True
 
         if update_uptime:
-            self.ds["resource"]["uptime"] = utc_from_timestamp(uptime_tm)
+            resource["uptime"] = utc_from_timestamp(uptime_tm)
 
-        if self.ds["resource"]["total-memory"] > 0:
-            self.ds["resource"]["memory-usage"] = round(
+        if resource["total-memory"] > 0:
+            resource["memory-usage"] = round(
                 (
                     (
-                        self.ds["resource"]["total-memory"]
-                        - self.ds["resource"]["free-memory"]
+                        resource["total-memory"]
+                        - resource["free-memory"]
                     )
-                    / self.ds["resource"]["total-memory"]
+                    / resource["total-memory"]
                 )
                 * 100
             )
         else:
-            self.ds["resource"]["memory-usage"] = "unknown"
+            resource["memory-usage"] = "unknown"
 
-        if self.ds["resource"]["total-hdd-space"] > 0:
-            self.ds["resource"]["hdd-usage"] = round(
+        if resource["total-hdd-space"] > 0:
+            resource["hdd-usage"] = round(
                 (
                     (
-                        self.ds["resource"]["total-hdd-space"]
-                        - self.ds["resource"]["free-hdd-space"]
+                        resource["total-hdd-space"]
+                        - resource["free-hdd-space"]
                     )
-                    / self.ds["resource"]["total-hdd-space"]
+                    / resource["total-hdd-space"]
                 )
                 * 100
             )
         else:
-            self.ds["resource"]["hdd-usage"] = "unknown"
+            resource["hdd-usage"] = "unknown"
 
         if (
-            "uptime_epoch" in self.ds["resource"]
-            and 0 < tmp_rebootcheck < self.ds["resource"]["uptime_epoch"]
+            "uptime_epoch" in resource
+            and 0 < tmp_rebootcheck < resource["uptime_epoch"]
         ):
             self.get_firmware_update()
 
@@ -1561,12 +1873,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.ds["fw-update"] = parse_api(
             data=self.ds["fw-update"],
             source=self.api.query("/system/package/update"),
-            vals=[
-                {"name": "status"},
-                {"name": "channel", "default": "unknown"},
-                {"name": "installed-version", "default": "unknown"},
-                {"name": "latest-version", "default": "unknown"},
-            ],
+            vals=_FW_UPDATE_VALS,
         )
 
         if "status" in self.ds["fw-update"]:
@@ -1591,7 +1898,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     self.minor_fw_version,
                     full_version
                 )
-            except Exception:
+            except (TypeError, ValueError, IndexError):
                 _LOGGER.error(
                     "Mikrotik %s unable to determine major FW version (%s).",
                     self.host,
@@ -1685,13 +1992,11 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get list of all scripts from Mikrotik"""
         self.ds["script"] = parse_api(
             data=self.ds["script"],
-            source=self.api.query("/system/script"),
+            source=self.api.query(
+                "/system/script", proplist=("name", "last-started", "run-count")
+            ),
             key="name",
-            vals=[
-                {"name": "name"},
-                {"name": "last-started", "default": "unknown"},
-                {"name": "run-count", "default": "unknown"},
-            ],
+            vals=_SCRIPT_VALS,
         )
 
     # ---------------------------
@@ -1701,7 +2006,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get list of all environment variables from Mikrotik"""
         self.ds["environment"] = parse_api(
             data=self.ds["environment"],
-            source=self.api.query("/system/script/environment"),
+            source=self.api.query(
+                "/system/script/environment", proplist=("name", "value")
+            ),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1714,9 +2021,17 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     def get_captive(self) -> None:
         """Get list of all environment variables from Mikrotik"""
+        source = self.api.query(
+            "/ip/hotspot/host",
+            proplist=("mac-address", "authorized", "bypassed"),
+        )
+        if source is None:
+            # Keep last known data on a failed fetch
+            return
+
         self.ds["hostspot_host"] = parse_api(
             data={},
-            source=self.api.query("/ip/hotspot/host"),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -1726,9 +2041,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
 
         auth_hosts = sum(
-            1
-            for uid in self.ds["hostspot_host"]
-            if self.ds["hostspot_host"][uid]["authorized"]
+            1 for vals in self.ds["hostspot_host"].values() if vals["authorized"]
         )
         self.ds["resource"]["captive_authorized"] = auth_hosts
 
@@ -1739,90 +2052,65 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get Queue data from Mikrotik"""
         self.ds["queue"] = parse_api(
             data=self.ds["queue"],
-            source=self.api.query("/queue/simple"),
+            source=self.api.query(
+                "/queue/simple",
+                proplist=(
+                    ".id",
+                    "name",
+                    "target",
+                    "rate",
+                    "max-limit",
+                    "limit-at",
+                    "burst-limit",
+                    "burst-threshold",
+                    "burst-time",
+                    "packet-marks",
+                    "parent",
+                    "comment",
+                    "disabled",
+                ),
+            ),
             key="name",
-            vals=[
-                {"name": ".id"},
-                {"name": "name", "default": "unknown"},
-                {"name": "target", "default": "unknown"},
-                {"name": "rate", "default": "0/0"},
-                {"name": "max-limit", "default": "0/0"},
-                {"name": "limit-at", "default": "0/0"},
-                {"name": "burst-limit", "default": "0/0"},
-                {"name": "burst-threshold", "default": "0/0"},
-                {"name": "burst-time", "default": "0s/0s"},
-                {"name": "packet-marks", "default": "none"},
-                {"name": "parent", "default": "none"},
-                {"name": "comment"},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+            vals=_QUEUE_VALS,
         )
 
         for uid, vals in self.ds["queue"].items():
-            self.ds["queue"][uid]["comment"] = str(self.ds["queue"][uid]["comment"])
+            vals["comment"] = str(vals["comment"])
 
-            upload_max_limit_bps, download_max_limit_bps = [
-                int(x) for x in vals["max-limit"].split("/")
-            ]
-            self.ds["queue"][uid]["upload-max-limit"] = f"{upload_max_limit_bps} bps"
-            self.ds["queue"][uid][
-                "download-max-limit"
-            ] = f"{download_max_limit_bps} bps"
-
-            upload_rate_bps, download_rate_bps = [
-                int(x) for x in vals["rate"].split("/")
-            ]
-            self.ds["queue"][uid]["upload-rate"] = f"{upload_rate_bps} bps"
-            self.ds["queue"][uid]["download-rate"] = f"{download_rate_bps} bps"
-
-            upload_limit_at_bps, download_limit_at_bps = [
-                int(x) for x in vals["limit-at"].split("/")
-            ]
-            self.ds["queue"][uid]["upload-limit-at"] = f"{upload_limit_at_bps} bps"
-            self.ds["queue"][uid]["download-limit-at"] = f"{download_limit_at_bps} bps"
-
-            upload_burst_limit_bps, download_burst_limit_bps = [
-                int(x) for x in vals["burst-limit"].split("/")
-            ]
-            self.ds["queue"][uid][
-                "upload-burst-limit"
-            ] = f"{upload_burst_limit_bps} bps"
-            self.ds["queue"][uid][
-                "download-burst-limit"
-            ] = f"{download_burst_limit_bps} bps"
-
-            upload_burst_threshold_bps, download_burst_threshold_bps = [
-                int(x) for x in vals["burst-threshold"].split("/")
-            ]
-            self.ds["queue"][uid][
-                "upload-burst-threshold"
-            ] = f"{upload_burst_threshold_bps} bps"
-            self.ds["queue"][uid][
-                "download-burst-threshold"
-            ] = f"{download_burst_threshold_bps} bps"
+            for src, upload_out, download_out in _QUEUE_LIMIT_FIELDS:
+                upload_bps, download_bps = vals[src].split("/", 1)
+                vals[upload_out] = f"{int(upload_bps)} bps"
+                vals[download_out] = f"{int(download_bps)} bps"
 
-            upload_burst_time, download_burst_time = vals["burst-time"].split("/")
-            self.ds["queue"][uid]["upload-burst-time"] = upload_burst_time
-            self.ds["queue"][uid]["download-burst-time"] = download_burst_time
+            upload_burst_time, download_burst_time = vals["burst-time"].split("/", 1)
+            vals["upload-burst-time"] = upload_burst_time
+            vals["download-burst-time"] = download_burst_time
 
     # ---------------------------
     #   get_arp
     # ---------------------------
     def get_arp(self) -> None:
         """Get ARP data from Mikrotik"""
+        source = self.api.query(
+            "/ip/arp", proplist=("mac-address", "address", "interface")
+        )
+        if source is None:
+            # Keep last known data on a failed fetch
+            return
+
         self.ds["arp"] = parse_api(
             data=self.ds["arp"],
-            source=self.api.query("/ip/arp"),
+            source=source,
             key="mac-address",
-            vals=[{"name": "mac-address"}, {"name": "address"}, {"name": "interface"}],
+            vals=_ARP_VALS,
             ensure_vals=[{"name": "bridge", "default": ""}],
         )
 
+        # Prune entries which disappeared from the router's table
+        seen = {entry["mac-address"] for entry in source if "mac-address" in entry}
+        for uid in [uid for uid in self.ds["arp"] if uid not in seen]:
+            del self.ds["arp"][uid]
+
         for uid, vals in self.ds["arp"].items():
             if vals["interface"] in self.ds["bridge"] and uid in self.ds["bridge_host"]:
                 self.ds["arp"][uid]["bridge"] = vals["interface"]
@@ -1847,9 +2135,11 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get static DNS data from Mikrotik"""
         self.ds["dns"] = parse_api(
             data=self.ds["dns"],
-            source=self.api.query("/ip/dns/static"),
+            source=self.api.query(
+                "/ip/dns/static", proplist=("name", "address", "comment")
+            ),
             key="name",
-            vals=[{"name": "name"}, {"name": "address"}, {"name": "comment"}],
+            vals=_DNS_VALS,
         )
 
         for uid, vals in self.ds["dns"].items():
@@ -1862,70 +2152,56 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get DHCP data from Mikrotik"""
         self.ds["dhcp"] = parse_api(
             data=self.ds["dhcp"],
-            source=self.api.query("/ip/dhcp-server/lease"),
+            source=self.api.query(
+                "/ip/dhcp-server/lease",
+                proplist=(
+                    "mac-address",
+                    "active-mac-address",
+                    "address",
+                    "active-address",
+                    "host-name",
+                    "status",
+                    "last-seen",
+                    "server",
+                    "comment",
+                    "disabled",
+                ),
+            ),
             key="mac-address",
-            vals=[
-                {"name": "mac-address"},
-                {"name": "active-mac-address", "default": "unknown"},
-                {"name": "address", "default": "unknown"},
-                {"name": "active-address", "default": "unknown"},
-                {"name": "host-name", "default": "unknown"},
-                {"name": "status", "default": "unknown"},
-                {"name": "last-seen", "default": "unknown"},
-                {"name": "server", "default": "unknown"},
-                {"name": "comment", "default": ""},
-                {
-                    "name": "enabled",
-                    "source": "disabled",
-                    "type": "bool",
-                    "reverse": True,
-                },
-            ],
+            vals=_DHCP_VALS,
             ensure_vals=[{"name": "interface", "default": "unknown"}],
         )
 
         dhcpserver_query = False
-        for uid in self.ds["dhcp"]:
-            self.ds["dhcp"][uid]["comment"] = str(self.ds["dhcp"][uid]["comment"])
+        for uid, vals in self.ds["dhcp"].items():
+            vals["comment"] = str(vals["comment"])
 
             # is_valid_ip
-            if self.ds["dhcp"][uid]["address"] != "unknown":
-                if not is_valid_ip(self.ds["dhcp"][uid]["address"]):
-                    self.ds["dhcp"][uid]["address"] = "unknown"
-
-                if self.ds["dhcp"][uid]["active-address"] not in [
-                    self.ds["dhcp"][uid]["address"],
-                    "unknown",
-                ]:
-                    self.ds["dhcp"][uid]["address"] = self.ds["dhcp"][uid][
-                        "active-address"
-                    ]
+            if vals["address"] != "unknown":
+                if not is_valid_ip(vals["address"]):
+                    vals["address"] = "unknown"
 
-                if (
-                    self.ds["dhcp"][uid]["mac-address"]
-                    != self.ds["dhcp"][uid]["active-mac-address"]
-                    != "unknown"
-                ):
-                    self.ds["dhcp"][uid]["mac-address"] = self.ds["dhcp"][uid][
-                        "active-mac-address"
-                    ]
+                if vals["active-address"] not in [vals["address"], "unknown"]:
+                    vals["address"] = vals["active-address"]
+
+                if vals["mac-address"] != vals["active-mac-address"] != "unknown":
+                    vals["mac-address"] = vals["active-mac-address"]
 
             if (
                 not dhcpserver_query
-                and self.ds["dhcp"][uid]["server"] not in self.ds["dhcp-server"]
+                and vals["server"] not in self.ds["dhcp-server"]
             ):
                 self.get_dhcp_server()
                 dhcpserver_query = True
 
-            if self.ds["dhcp"][uid]["server"] in self.ds["dhcp-server"]:
-                self.ds["dhcp"][uid]["interface"] = self.ds["dhcp-server"][
-                    self.ds["dhcp"][uid]["server"]
-                ]["interface"]
+            if vals["server"] in self.ds["dhcp-server"]:
+                vals["interface"] = self.ds["dhcp-server"][vals["server"]]["interface"]
             elif uid in self.ds["arp"]:
-                if self.ds["arp"][uid]["bridge"] != "unknown":
-                    self.ds["dhcp"][uid]["interface"] = self.ds["arp"][uid]["bridge"]
+                arp_vals = self.ds["arp"][uid]
+                if arp_vals["bridge"] != "unknown":
+                    vals["interface"] = arp_vals["bridge"]
                 else:
-                    self.ds["dhcp"][uid]["interface"] = self.ds["arp"][uid]["interface"]
+                    vals["interface"] = arp_vals["interface"]
 
     # ---------------------------
     #   get_dhcp_server
@@ -1934,7 +2210,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get DHCP server data from Mikrotik"""
         self.ds["dhcp-server"] = parse_api(
             data=self.ds["dhcp-server"],
-            source=self.api.query("/ip/dhcp-server"),
+            source=self.api.query(
+                "/ip/dhcp-server", proplist=("name", "interface")
+            ),
             key="name",
             vals=[
                 {"name": "name"},
@@ -1949,7 +2227,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         """Get DHCP client data from Mikrotik"""
         self.ds["dhcp-client"] = parse_api(
             data=self.ds["dhcp-client"],
-            source=self.api.query("/ip/dhcp-client"),
+            source=self.api.query(
+                "/ip/dhcp-client", proplist=("interface", "status")
+            ),
             key="interface",
             vals=[
                 {"name": "interface", "default": "unknown"},
@@ -1994,9 +2274,17 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         else:
             registration_path= "/caps-man/registration-table"
             
+        source = self.api.query(
+            registration_path,
+            proplist=("mac-address", "interface", "ssid"),
+        )
+        if source is None:
+            # Keep last known data on a failed fetch
+            return
+
         self.ds["capsman_hosts"] = parse_api(
             data={},
-            source=self.api.query(registration_path),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2043,26 +2331,32 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
-        for uid in self.ds["wireless"]:
-            if self.ds["wireless"][uid]["master-interface"]:
-                for tmp in self.ds["wireless"][uid]:
-                    if self.ds["wireless"][uid][tmp] == "unknown":
-                        self.ds["wireless"][uid][tmp] = self.ds["wireless"][
-                            self.ds["wireless"][uid]["master-interface"]
-                        ][tmp]
+        for uid, vals in self.ds["wireless"].items():
+            if vals["master-interface"]:
+                master_vals = self.ds["wireless"][vals["master-interface"]]
+                for tmp, value in vals.items():
+                    if value == "unknown":
+                        vals[tmp] = master_vals[tmp]
 
             if uid in self.ds["interface"]:
-                for tmp in self.ds["wireless"][uid]:
-                    self.ds["interface"][uid][tmp] = self.ds["wireless"][uid][tmp]
+                self.ds["interface"][uid].update(vals)
 
     # ---------------------------
     #   get_wireless_hosts
     # ---------------------------
     def get_wireless_hosts(self) -> None:
         """Get wireless hosts data from Mikrotik"""
+        source = self.api.query(
+            f"/interface/{self._wifimodule}/registration-table",
+            proplist=("mac-address", "interface", "ap", "uptime"),
+        )
+        if source is None:
+            # Keep last known data on a failed fetch
+            return
+
         self.ds["wireless_hosts"] = parse_api(
             data={},
-            source=self.api.query(f"/interface/{self._wifimodule}/registration-table"),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2081,16 +2375,17 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         capsman_detected = {}
         if self.support_capsman:
             for uid, vals in self.ds["capsman_hosts"].items():
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "capsman"}
-                elif self.ds["host"][uid]["source"] != "capsman":
+                host = self.ds["host"].get(uid)
+                if host is None:
+                    host = self.ds["host"][uid] = {"source": "capsman"}
+                elif host["source"] != "capsman":
                     continue
 
                 capsman_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
-                for key in ["mac-address", "interface"]:
-                    self.ds["host"][uid][key] = vals[key]
+                host["available"] = True
+                host["last-seen"] = utcnow()
+                for key in _HOST_LINK_KEYS:
+                    host[key] = vals[key]
 
         # Add hosts from wireless
         wireless_detected = {}
@@ -2099,69 +2394,69 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 if vals["ap"]:
                     continue
 
-                if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "wireless"}
-                elif self.ds["host"][uid]["source"] != "wireless":
+                host = self.ds["host"].get(uid)
+                if host is None:
+                    host = self.ds["host"][uid] = {"source": "wireless"}
+                elif host["source"] != "wireless":
                     continue
 
                 wireless_detected[uid] = True
-                self.ds["host"][uid]["available"] = True
-                self.ds["host"][uid]["last-seen"] = utcnow()
-                for key in ["mac-address", "interface"]:
-                    self.ds["host"][uid][key] = vals[key]
+                host["available"] = True
+                host["last-seen"] = utcnow()
+                for key in _HOST_LINK_KEYS:
+                    host[key] = vals[key]
 
         # Add hosts from DHCP
         for uid, vals in self.ds["dhcp"].items():
             if not vals["enabled"]:
                 continue
 
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "dhcp"}
-            elif self.ds["host"][uid]["source"] != "dhcp":
+            host = self.ds["host"].get(uid)
+            if host is None:
+                host = self.ds["host"][uid] = {"source": "dhcp"}
+            elif host["source"] != "dhcp":
                 continue
 
-            for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+            for key in _HOST_SRC_KEYS:
+                host[key] = vals[key]
 
         # Add hosts from ARP
         for uid, vals in self.ds["arp"].items():
-            if uid not in self.ds["host"]:
-                self.ds["host"][uid] = {"source": "arp"}
-            elif self.ds["host"][uid]["source"] != "arp":
+            host = self.ds["host"].get(uid)
+            if host is None:
+                host = self.ds["host"][uid] = {"source": "arp"}
+            elif host["source"] != "arp":
                 continue
 
-            for key in ["address", "mac-address", "interface"]:
-                self.ds["host"][uid][key] = vals[key]
+            for key in _HOST_SRC_KEYS:
+                host[key] = vals[key]
 
         # Add restored hosts from hass registry
         if not self.host_hass_recovered:
             self.host_hass_recovered = True
-            for uid in self.ds["host_hass"]:
+            for uid, original_name in self.ds["host_hass"].items():
                 if uid not in self.ds["host"]:
-                    self.ds["host"][uid] = {"source": "restored"}
-                    self.ds["host"][uid]["mac-address"] = uid
-                    self.ds["host"][uid]["host-name"] = self.ds["host_hass"][uid]
+                    self.ds["host"][uid] = {
+                        "source": "restored",
+                        "mac-address": uid,
+                        "host-name": original_name,
+                    }
 
         for uid, vals in self.ds["host"].items():
             # Add missing default values
-            for key, default in zip(
-                [
-                    "address",
-                    "mac-address",
-                    "interface",
-                    "host-name",
-                    "manufacturer",
-                    "last-seen",
-                    "available",
-                ],
-                ["unknown", "unknown", "unknown", "unknown", "detect", False, False],
-            ):
-                if key not in self.ds["host"][uid]:
-                    self.ds["host"][uid][key] = default
+            for key, default in _HOST_DEFAULTS:
+                if key not in vals:
+                    vals[key] = default
 
         # if not self.host_tracking_initialized:
         #     await self.async_ping_tracked_hosts()
 
+        # Index static DNS by address; keep the first row per address to
+        # match the previous first-match scan
+        dns_by_address = {}
+        for dns_vals in self.ds["dns"].values():
+            dns_by_address.setdefault(dns_vals["address"], dns_vals)
+
         # Process hosts
         self.ds["resource"]["clients_wired"] = 0
         self.ds["resource"]["clients_wireless"] = 0
@@ -2169,23 +2464,19 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             # Captive portal data
             if self.option_sensor_client_captive:
                 if uid in self.ds["hostspot_host"]:
-                    self.ds["host"][uid]["authorized"] = self.ds["hostspot_host"][uid][
-                        "authorized"
-                    ]
-                    self.ds["host"][uid]["bypassed"] = self.ds["hostspot_host"][uid][
-                        "bypassed"
-                    ]
-                elif "authorized" in self.ds["host"][uid]:
-                    del self.ds["host"][uid]["authorized"]
-                    del self.ds["host"][uid]["bypassed"]
+                    vals["authorized"] = self.ds["hostspot_host"][uid]["authorized"]
+                    vals["bypassed"] = self.ds["hostspot_host"][uid]["bypassed"]
+                elif "authorized" in vals:
+                    del vals["authorized"]
+                    del vals["bypassed"]
 
             # CAPS-MAN availability
             if vals["source"] == "capsman" and uid not in capsman_detected:
-                self.ds["host"][uid]["available"] = False
+                vals["available"] = False
 
             # Wireless availability
             if vals["source"] == "wireless" and uid not in wireless_detected:
-                self.ds["host"][uid]["available"] = False
+                vals["available"] = False
 
             # Update IP and interface (DHCP/returned host)
             if (
@@ -2193,86 +2484,68 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 and self.ds["dhcp"][uid]["enabled"]
                 and "." in self.ds["dhcp"][uid]["address"]
             ):
-                if self.ds["dhcp"][uid]["address"] != self.ds["host"][uid]["address"]:
-                    self.ds["host"][uid]["address"] = self.ds["dhcp"][uid]["address"]
+                if self.ds["dhcp"][uid]["address"] != vals["address"]:
+                    vals["address"] = self.ds["dhcp"][uid]["address"]
                     if vals["source"] not in ["capsman", "wireless"]:
-                        self.ds["host"][uid]["source"] = "dhcp"
-                        self.ds["host"][uid]["interface"] = self.ds["dhcp"][uid][
-                            "interface"
-                        ]
+                        vals["source"] = "dhcp"
+                        vals["interface"] = self.ds["dhcp"][uid]["interface"]
 
             elif (
                 uid in self.ds["arp"]
                 and "." in self.ds["arp"][uid]["address"]
-                and self.ds["arp"][uid]["address"] != self.ds["host"][uid]["address"]
+                and self.ds["arp"][uid]["address"] != vals["address"]
             ):
-                self.ds["host"][uid]["address"] = self.ds["arp"][uid]["address"]
+                vals["address"] = self.ds["arp"][uid]["address"]
                 if vals["source"] not in ["capsman", "wireless"]:
-                    self.ds["host"][uid]["source"] = "arp"
-                    self.ds["host"][uid]["interface"] = self.ds["arp"][uid]["interface"]
+                    vals["source"] = "arp"
+                    vals["interface"] = self.ds["arp"][uid]["interface"]
 
             if vals["host-name"] == "unknown":
+                dhcp_vals = self.ds["dhcp"].get(uid)
+                dhcp_comment = ""
+                dhcp_hostname = "unknown"
+                if dhcp_vals is not None and dhcp_vals["enabled"]:
+                    dhcp_comment = dhcp_vals["comment"].split("#", 1)[0]
+                    dhcp_hostname = dhcp_vals["host-name"]
+
                 # Resolve hostname from static DNS
                 if vals["address"] != "unknown":
-                    for dns_uid, dns_vals in self.ds["dns"].items():
-                        if dns_vals["address"] == vals["address"]:
-                            if dns_vals["comment"].split("#", 1)[0] != "":
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "comment"
-                                ].split("#", 1)[0]
-                            elif (
-                                uid in self.ds["dhcp"]
-                                and self.ds["dhcp"][uid]["enabled"]
-                                and self.ds["dhcp"][uid]["comment"].split("#", 1)[0]
-                                != ""
-                            ):
-                                # Override name if DHCP comment exists
-                                self.ds["host"][uid]["host-name"] = self.ds["dhcp"][
-                                    uid
-                                ]["comment"].split("#", 1)[0]
-                            else:
-                                self.ds["host"][uid]["host-name"] = dns_vals[
-                                    "name"
-                                ].split(".")[0]
-                            break
-
-                if self.ds["host"][uid]["host-name"] == "unknown":
+                    dns_vals = dns_by_address.get(vals["address"])
+                    if dns_vals is not None:
+                        dns_comment = dns_vals["comment"].split("#", 1)[0]
+                        if dns_comment != "":
+                            vals["host-name"] = dns_comment
+                        elif dhcp_comment != "":
+                            # Override name if DHCP comment exists
+                            vals["host-name"] = dhcp_comment
+                        else:
+                            vals["host-name"] = dns_vals["name"].split(".", 1)[0]
+
+                if vals["host-name"] == "unknown":
                     # Resolve hostname from DHCP comment
-                    if (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["comment"].split("#", 1)[0] != ""
-                    ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "comment"
-                        ].split("#", 1)[0]
+                    if dhcp_comment != "":
+                        vals["host-name"] = dhcp_comment
                     # Resolve hostname from DHCP hostname
-                    elif (
-                        uid in self.ds["dhcp"]
-                        and self.ds["dhcp"][uid]["enabled"]
-                        and self.ds["dhcp"][uid]["host-name"] != "unknown"
-                    ):
-                        self.ds["host"][uid]["host-name"] = self.ds["dhcp"][uid][
-                            "host-name"
-                        ]
+                    elif dhcp_hostname != "unknown":
+                        vals["host-name"] = dhcp_hostname
                     # Fallback to mac address for hostname
                     else:
-                        self.ds["host"][uid]["host-name"] = uid
+                        vals["host-name"] = uid
 
             # Resolve manufacturer
             if vals["manufacturer"] == "detect" and vals["mac-address"] != "unknown":
                 try:
-                    self.ds["host"][uid][
-                        "manufacturer"
-                    ] = await self.async_mac_lookup.lookup(vals["mac-address"])
+                    vals["manufacturer"] = await self.async_mac_lookup.lookup(
+                        vals["mac-address"]
+                    )
                 except Exception:
-                    self.ds["host"][uid]["manufacturer"] = ""
+                    vals["manufacturer"] = ""
 
             if vals["manufacturer"] == "detect":
-                self.ds["host"][uid]["manufacturer"] = ""
+                vals["manufacturer"] = ""
 
             # Count hosts
-            if self.ds["host"][uid]["available"]:
+            if vals["available"]:
                 if vals["source"] in ["capsman", "wireless"]:
                     self.ds["resource"]["clients_wireless"] += 1
                 else:
@@ -2329,17 +2602,18 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 ],
             )
 
-            threshold = self.api.query("/ip/accounting")[0].get("threshold")
+            accounting = self.api.query("/ip/accounting")
+            threshold = accounting[0].get("threshold") if accounting else None
             entry_count = len(accounting_data)
 
-            if entry_count == threshold:
+            if threshold is not None and entry_count == threshold:
                 _LOGGER.warning(
                     f"Accounting entries count reached the threshold of {threshold}!"
                     " Some entries were not saved by Mikrotik so accounting calculation won't be correct."
                     " Consider shortening update interval or"
                     " increasing the accounting threshold value in Mikrotik."
                 )
-            elif entry_count > threshold * 0.9:
+            elif threshold is not None and entry_count > threshold * 0.9:
                 _LOGGER.info(
                     f"Accounting entries count ({entry_count} reached 90% of the threshold,"
                     f" currently set to {threshold}! Consider shortening update interval or"
@@ -2350,24 +2624,24 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 source_ip = str(item.get("src-address")).strip()
                 destination_ip = str(item.get("dst-address")).strip()
                 bits_count = int(str(item.get("bytes")).strip())
+                source_local = self._address_part_of_local_network(source_ip)
+                destination_local = self._address_part_of_local_network(
+                    destination_ip
+                )
 
-                if self._address_part_of_local_network(
-                    source_ip
-                ) and self._address_part_of_local_network(destination_ip):
+                if source_local and destination_local:
                     # LAN TX/RX
                     if source_ip in tmp_accounting_values:
                         tmp_accounting_values[source_ip]["lan-tx"] += bits_count
                     if destination_ip in tmp_accounting_values:
                         tmp_accounting_values[destination_ip]["lan-rx"] += bits_count
-                elif self._address_part_of_local_network(
-                    source_ip
-                ) and not self._address_part_of_local_network(destination_ip):
+                elif source_local and not destination_local:
                     # WAN TX
                     if source_ip in tmp_accounting_values:
                         tmp_accounting_values[source_ip]["wan-tx"] += bits_count
                 elif (
-                    not self._address_part_of_local_network(source_ip)
-                    and self._address_part_of_local_network(destination_ip)
+                    not source_local
+                    and destination_local
                     and destination_ip in tmp_accounting_values
                 ):
                     # WAN RX
@@ -2412,7 +2686,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     #   _address_part_of_local_network
     # ---------------------------
     def _address_part_of_local_network(self, address) -> bool:
-        address = ip_address(address)
+        address = _parse_ip_address(address)
         for vals in self.ds["dhcp-network"].values():
             if address in vals["IPv4Network"]:
                 return True
@@ -2427,19 +2701,6 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 return mac
         return None
 
-    # ---------------------------
-    #   _get_iface_from_entry
-    # ---------------------------
-    def _get_iface_from_entry(self, entry):
-        """Get interface default-name using name from interface dict"""
-        uid = None
-        for ifacename in self.ds["interface"]:
-            if self.ds["interface"][ifacename]["name"] == entry["interface"]:
-                uid = ifacename
-                break
-
-        return uid
-
     # ---------------------------
     #   process_kid_control
     # ---------------------------
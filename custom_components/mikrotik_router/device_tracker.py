@@ -8,7 +8,7 @@ from typing import Any, Callable
 
 from homeassistant.components.device_tracker.config_entry import ScannerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.const import STATE_NOT_HOME
 from homeassistant.helpers import (
     entity_platform as ep,
@@ -16,7 +16,6 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
 
 from homeassistant.components.device_tracker.const import SourceType
@@ -47,51 +46,60 @@ async def async_add_entities(
     for service in services:
         platform.async_register_entity_service(service[0], service[1], service[2])
 
-    @callback
-    async def async_update_controller(coordinator):
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].tracker_coordinator
+
+    # Rows already checked against the registry; each poll only has to
+    # look at newly discovered ones
+    processed: set[tuple[str, str | None]] = set()
+
+    async def async_update_controller(*_) -> None:
         """Update the values of the controller."""
         if coordinator.data is None:
             return
 
-        async def async_check_exist(obj, coordinator, uid: None) -> None:
-            """Check entity exists."""
-            entity_registry = er.async_get(hass)
-            if uid:
-                unique_id = f"{obj._inst.lower()}-{obj.entity_description.key}-{slugify(str(obj._data[obj.entity_description.data_reference]).lower())}"
-            else:
-                unique_id = f"{obj._inst.lower()}-{obj.entity_description.key}"
+        new_entities = []
 
+        def check_exist(obj) -> None:
+            """Queue the entity for adding if the registry lacks it."""
+            entity_registry = er.async_get(hass)
             entity_id = entity_registry.async_get_entity_id(
-                platform.domain, DOMAIN, unique_id
+                platform.domain, DOMAIN, obj.unique_id
             )
             entity = entity_registry.async_get(entity_id)
             if entity is None or (
                 (entity_id not in platform.entities) and (entity.disabled is False)
             ):
                 _LOGGER.debug("Add entity %s", entity_id)
-                await platform.async_add_entities([obj])
+                new_entities.append(obj)
 
         for entity_description in descriptions:
             data = coordinator.data[entity_description.data_path]
             if not entity_description.data_reference:
+                if (entity_description.key, None) in processed:
+                    continue
                 if data.get(entity_description.data_attribute) is None:
                     continue
                 obj = dispatcher[entity_description.func](
                     coordinator, entity_description
                 )
-                await async_check_exist(obj, coordinator, None)
+                check_exist(obj)
+                processed.add((entity_description.key, None))
             else:
                 for uid in data:
+                    if (entity_description.key, uid) in processed:
+                        continue
                     if _skip_sensor(config_entry, entity_description, data, uid):
                         continue
                     obj = dispatcher[entity_description.func](
                         coordinator, entity_description, uid
                     )
-                    await async_check_exist(obj, coordinator, uid)
+                    check_exist(obj)
+                    processed.add((entity_description.key, uid))
+
+        if new_entities:
+            await platform.async_add_entities(new_entities)
 
-    await async_update_controller(
-        hass.data[DOMAIN][config_entry.entry_id].tracker_coordinator
-    )
+    await async_update_controller()
 
     unsub = async_dispatcher_connect(hass, "update_sensors", async_update_controller)
     config_entry.async_on_unload(unsub)
@@ -221,10 +229,11 @@ class MikrotikHostDeviceTracker(MikrotikDeviceTracker):
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
         attributes = super().extra_state_attributes
+        last_seen = format_attribute("last-seen")
         if self.is_connected:
-            attributes[format_attribute("last-seen")] = "Now"
+            attributes[last_seen] = "Now"
 
-        if not attributes[format_attribute("last-seen")]:
-            attributes[format_attribute("last-seen")] = "Unknown"
+        if not attributes[last_seen]:
+            attributes[last_seen] = "Unknown"
 
         return attributes
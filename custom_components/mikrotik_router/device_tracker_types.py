@@ -2,20 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
 
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 
-DEVICE_ATTRIBUTES_HOST = [
+DEVICE_ATTRIBUTES_HOST = (
     "interface",
     "source",
     "authorized",
     "bypassed",
     "last-seen",
-]
+)
 
 
 @dataclass
@@ -36,7 +35,7 @@ class MikrotikDeviceTrackerEntityDescription(SwitchEntityDescription):
     data_name_comment: bool = False
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: list = field(default_factory=lambda: [])
     func: str = "MikrotikDeviceTracker"
 
 
@@ -102,49 +102,58 @@ async def async_add_entities(
     for service in services:
         platform.async_register_entity_service(service[0], service[1], service[2])
 
-    @callback
-    async def async_update_controller(coordinator):
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].data_coordinator
+
+    # Rows already checked against the registry; each poll only has to
+    # look at newly discovered ones
+    processed: set[tuple[str, str | None]] = set()
+
+    async def async_update_controller(*_) -> None:
         """Update the values of the controller."""
 
-        async def async_check_exist(obj, coordinator, uid: None) -> None:
-            """Check entity exists."""
-            entity_registry = er.async_get(hass)
-            if uid:
-                unique_id = f"{obj._inst.lower()}-{obj.entity_description.key}-{slugify(str(obj._data[obj.entity_description.data_reference]).lower())}"
-            else:
-                unique_id = f"{obj._inst.lower()}-{obj.entity_description.key}"
+        new_entities = []
 
+        def check_exist(obj) -> None:
+            """Queue the entity for adding if the registry lacks it."""
+            entity_registry = er.async_get(hass)
             entity_id = entity_registry.async_get_entity_id(
-                platform.domain, DOMAIN, unique_id
+                platform.domain, DOMAIN, obj.unique_id
             )
             entity = entity_registry.async_get(entity_id)
             if entity is None or (
                 (entity_id not in platform.entities) and (entity.disabled is False)
             ):
                 _LOGGER.debug("Add entity %s", entity_id)
-                await platform.async_add_entities([obj])
+                new_entities.append(obj)
 
         for entity_description in descriptions:
             data = coordinator.data[entity_description.data_path]
             if not entity_description.data_reference:
+                if (entity_description.key, None) in processed:
+                    continue
                 if data.get(entity_description.data_attribute) is None:
                     continue
                 obj = dispatcher[entity_description.func](
                     coordinator, entity_description
                 )
-                await async_check_exist(obj, coordinator, None)
+                check_exist(obj)
+                processed.add((entity_description.key, None))
             else:
                 for uid in data:
+                    if (entity_description.key, uid) in processed:
+                        continue
                     if _skip_sensor(config_entry, entity_description, data, uid):
                         continue
                     obj = dispatcher[entity_description.func](
                         coordinator, entity_description, uid
                     )
-                    await async_check_exist(obj, coordinator, uid)
+                    check_exist(obj)
+                    processed.add((entity_description.key, uid))
+
+        if new_entities:
+            await platform.async_add_entities(new_entities)
 
-    await async_update_controller(
-        hass.data[DOMAIN][config_entry.entry_id].data_coordinator
-    )
+    await async_update_controller()
 
     unsub = async_dispatcher_connect(hass, "update_sensors", async_update_controller)
     config_entry.async_on_unload(unsub)
@@ -181,6 +190,16 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
         if self._uid:
             self._data = coordinator.data[self.entity_description.data_path][self._uid]
 
+        if self._uid:
+            self._attr_unique_id = f"{self._inst.lower()}-{self.entity_description.key}-{slugify(str(self._data[self.entity_description.data_reference]).lower())}"
+        else:
+            self._attr_unique_id = f"{self._inst.lower()}-{self.entity_description.key}"
+
+        self._refresh_entity_attrs()
+
+    @callback
+    def _refresh_entity_attrs(self) -> None:
+        """Recompute cached _attr_* values after _data is rebound."""
         self._attr_name = self.custom_name
 
     @callback
@@ -190,43 +209,30 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
             self._data = self.coordinator.data[self.entity_description.data_path][
                 self._uid
             ]
+        self._refresh_entity_attrs()
         super()._handle_coordinator_update()
 
     @property
     def custom_name(self) -> str:
         """Return the name for this entity"""
+        description = self.entity_description
+        data = self._data
         if not self._uid:
-            if self.entity_description.data_name_comment and self._data["comment"]:
-                return f"{self._data['comment']}"
-
-            return f"{self.entity_description.name}"
+            if description.data_name_comment and data["comment"]:
+                return f"{data['comment']}"
 
-        if self.entity_description.data_name_comment and self._data["comment"]:
-            return f"{self._data['comment']}"
-
-        if self.entity_description.name:
-            if (
-                self._data[self.entity_description.data_reference]
-                == self._data[self.entity_description.data_name]
-            ):
-                return f"{self.entity_description.name}"
+            return f"{description.name}"
 
-            return f"{self._data[self.entity_description.data_name]} {self.entity_description.name}"
+        if description.data_name_comment and data["comment"]:
+            return f"{data['comment']}"
 
-        return f"{self._data[self.entity_description.data_name]}"
+        if description.name:
+            if data[description.data_reference] == data[description.data_name]:
+                return f"{description.name}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique id for this entity"""
-        if self._uid:
-            return f"{self._inst.lower()}-{self.entity_description.key}-{slugify(str(self._data[self.entity_description.data_reference]).lower())}"
-        else:
-            return f"{self._inst.lower()}-{self.entity_description.key}"
+            return f"{data[description.data_name]} {description.name}"
 
-    # @property
-    # def available(self) -> bool:
-    #     """Return if controller is available"""
-    #     return self.coordinator.connected()
+        return f"{data[description.data_name]}"
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -238,6 +244,13 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
             dev_group = self.coordinator.data["resource"]["board-name"]
             dev_connection_value = self.coordinator.data["routerboard"]["serial-number"]
 
+        return self._build_device_info(dev_connection, dev_connection_value, dev_group)
+
+    def _build_device_info(
+        self, dev_connection, dev_connection_value, dev_group
+    ) -> DeviceInfo:
+        """Build the DeviceInfo, memoized per device on the coordinator."""
+
         if self.entity_description.ha_group.startswith("data__"):
             dev_group = self.entity_description.ha_group[6:]
             if dev_group in self._data:
@@ -253,55 +266,72 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
                 dev_connection_value = dev_connection_value[6:]
                 dev_connection_value = self._data[dev_connection_value]
 
+        data = self.coordinator.data
+        # Key on the firmware version too, so entries rebuilt after a
+        # RouterOS upgrade do not register the pre-upgrade sw_version
+        cache_key = (
+            dev_connection,
+            dev_connection_value,
+            dev_group,
+            data.get("resource", {}).get("version"),
+        )
+        cached = self.coordinator.device_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if self.entity_description.ha_group == "System":
-            return DeviceInfo(
+            resource = data["resource"]
+            info = DeviceInfo(
                 connections={(dev_connection, f"{dev_connection_value}")},
                 identifiers={(dev_connection, f"{dev_connection_value}")},
                 name=f"{self._inst} {dev_group}",
-                model=f"{self.coordinator.data['resource']['board-name']}",
-                manufacturer=f"{self.coordinator.data['resource']['platform']}",
-                sw_version=f"{self.coordinator.data['resource']['version']}",
+                model=f"{resource['board-name']}",
+                manufacturer=f"{resource['platform']}",
+                sw_version=f"{resource['version']}",
                 configuration_url=f"http://{self.coordinator.config_entry.data[CONF_HOST]}",
             )
         elif "mac-address" in self.entity_description.data_reference:
             dev_group = self._data[self.entity_description.data_name]
             dev_manufacturer = ""
-            if dev_connection_value in self.coordinator.data["host"]:
-                dev_group = self.coordinator.data["host"][dev_connection_value][
-                    "host-name"
-                ]
-                dev_manufacturer = self.coordinator.data["host"][dev_connection_value][
-                    "manufacturer"
-                ]
-
-            return DeviceInfo(
+            host = data["host"].get(dev_connection_value)
+            if host is not None:
+                dev_group = host["host-name"]
+                dev_manufacturer = host["manufacturer"]
+
+            info = DeviceInfo(
                 connections={(dev_connection, f"{dev_connection_value}")},
                 default_name=f"{dev_group}",
                 default_manufacturer=f"{dev_manufacturer}",
                 via_device=(
                     DOMAIN,
-                    f"{self.coordinator.data['routerboard']['serial-number']}",
+                    f"{data['routerboard']['serial-number']}",
                 ),
             )
         else:
-            return DeviceInfo(
+            resource = data["resource"]
+            info = DeviceInfo(
                 connections={(dev_connection, f"{dev_connection_value}")},
                 default_name=f"{self._inst} {dev_group}",
-                default_model=f"{self.coordinator.data['resource']['board-name']}",
-                default_manufacturer=f"{self.coordinator.data['resource']['platform']}",
+                default_model=f"{resource['board-name']}",
+                default_manufacturer=f"{resource['platform']}",
                 via_device=(
                     DOMAIN,
-                    f"{self.coordinator.data['routerboard']['serial-number']}",
+                    f"{data['routerboard']['serial-number']}",
                 ),
             )
 
+        self.coordinator.device_info_cache[cache_key] = info
+        return info
+
     @property
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
         attributes = super().extra_state_attributes
+        data = self._data
         for variable in self.entity_description.data_attributes_list:
-            if variable in self._data:
-                attributes[format_attribute(variable)] = self._data[variable]
+            value = data.get(variable)
+            if value is not None:
+                attributes[format_attribute(variable)] = value
 
         return attributes
 
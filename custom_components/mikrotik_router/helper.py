@@ -1,9 +1,11 @@
 """Helper functions for Mikrotik Router."""
+from functools import lru_cache
 
 
 # ---------------------------
 #   format_attribute
 # ---------------------------
+@lru_cache(maxsize=None)
 def format_attribute(attr):
     res = attr.replace("-", "_")
     res = res.replace(" ", "_")
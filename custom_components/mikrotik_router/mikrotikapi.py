@@ -1,16 +1,17 @@
 """Mikrotik API for Mikrotik Router."""
+from __future__ import annotations
 
 import logging
 import ssl
 from time import time
 from threading import Lock
-from voluptuous import Optional
 from .const import (
     DEFAULT_LOGIN_METHOD,
     DEFAULT_ENCODING,
 )
 
 import librouteros
+from librouteros.query import Key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +22,27 @@ _LOGGER = logging.getLogger(__name__)
 class MikrotikAPI:
     """Handle all communication with the Mikrotik API."""
 
+    __slots__ = (
+        "_host",
+        "_use_ssl",
+        "_port",
+        "_username",
+        "_password",
+        "_login_method",
+        "_encoding",
+        "_ssl_wrapper",
+        "lock",
+        "_connection",
+        "_path_cache",
+        "_connected",
+        "_reconnected",
+        "_connection_epoch",
+        "_connection_retry_sec",
+        "error",
+        "connection_error_reported",
+        "client_traffic_last_run",
+    )
+
     def __init__(
         self,
         host,
@@ -43,6 +65,8 @@ class MikrotikAPI:
         self.lock = Lock()
 
         self._connection = None
+        # Path handles resolved on the live connection, keyed by path string
+        self._path_cache = {}
         self._connected = False
         self._reconnected = True
         self._connection_epoch = 0
@@ -101,6 +125,7 @@ class MikrotikAPI:
         self._reconnected = False
         self._connected = False
         self._connection = None
+        self._path_cache = {}
         self._connection_epoch = 0
 
     # ---------------------------
@@ -126,6 +151,7 @@ class MikrotikAPI:
                 self._ssl_wrapper = ssl_context.wrap_socket
             kwargs["ssl_wrapper"] = self._ssl_wrapper
         self.lock.acquire()
+        self._path_cache = {}
         try:
             self._connection = librouteros.connect(
                 self._host, self._username, self._password, **kwargs
@@ -174,7 +200,9 @@ class MikrotikAPI:
     # ---------------------------
     #   query
     # ---------------------------
-    def query(self, path, command=None, args=None, return_list=True) -> Optional(list):
+    def query(
+        self, path, command=None, args=None, return_list=True, proplist=None, where=None
+    ) -> list | None:
         """Retrieve data from Mikrotik API."""
         """Returns generator object, unless return_list passed as True"""
         if args is None:
@@ -186,13 +214,29 @@ class MikrotikAPI:
         self.lock.acquire()
         try:
             _LOGGER.debug("API query: %s", path)
-            response = self._connection.path(path)
+            response = self._path_cache.get(path)
+            if response is None:
+                response = self._path_cache[path] = self._connection.path(path)
         except Exception as e:
             self.disconnect("path", e)
             self.lock.release()
             return None
 
-        if response and return_list and not command:
+        if response and proplist and not command:
+            # Let the router filter and trim the response instead of
+            # transferring every property of every row
+            try:
+                api_query = response.select(*(Key(name) for name in proplist))
+                if where:
+                    api_query = api_query.where(
+                        *(Key(name) == value for name, value in where.items())
+                    )
+                response = list(api_query)
+            except Exception as e:
+                self.disconnect(f"building list for path {path}", e)
+                self.lock.release()
+                return None
+        elif response and return_list and not command:
             try:
                 response = list(response)
             except Exception as e:
@@ -218,23 +262,25 @@ class MikrotikAPI:
         """Modify a parameter"""
         entry_found = None
 
-        if not self.connection_check():
-            return False
-
         response = self.query(path, return_list=False)
         if response is None:
             return False
 
-        for tmp in response:
-            if param not in tmp:
-                continue
-
-            if tmp[param] != value:
-                continue
-
-            entry_found = tmp[".id"]
+        self.lock.acquire()
+        try:
+            # Resolve the target .id on the router instead of pulling the
+            # whole table across the wire
+            for tmp in response.select(Key(".id"), Key(param)).where(
+                Key(param) == value
+            ):
+                entry_found = tmp[".id"]
+        except Exception as e:
+            self.disconnect("set_value", e)
+            self.lock.release()
+            return False
 
         if not entry_found:
+            self.lock.release()
             _LOGGER.error(
                 "Mikrotik %s set_value parameter %s with value %s not found",
                 self._host,
@@ -244,7 +290,6 @@ class MikrotikAPI:
             return True
 
         params = {".id": entry_found, mod_param: mod_value}
-        self.lock.acquire()
         try:
             response.update(**params)
         except Exception as e:
@@ -263,9 +308,6 @@ class MikrotikAPI:
         entry_found = None
         params = {}
 
-        if not self.connection_check():
-            return False
-
         response = self.query(path, return_list=False)
         if response is None:
             return False
@@ -312,9 +354,6 @@ class MikrotikAPI:
     def run_script(self, name) -> bool:
         """Run script"""
         entry_found = None
-        if not self.connection_check():
-            return False
-
         response = self.query("/system/script", return_list=False)
         if response is None:
             return False
@@ -349,9 +388,6 @@ class MikrotikAPI:
     # ---------------------------
     def arp_ping(self, address, interface) -> bool:
         """Check arp ping response traffic stats"""
-        if not self.connection_check():
-            return False
-
         response = self.query("/ping", return_list=False)
         if response is None:
             return False
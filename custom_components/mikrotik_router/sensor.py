@@ -90,21 +90,25 @@ class MikrotikInterfaceTrafficSensor(MikrotikSensor):
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
         attributes = super().extra_state_attributes
+        data = self._data
 
-        if self._data["type"] == "ether":
+        if data["type"] == "ether":
             for variable in DEVICE_ATTRIBUTES_IFACE_ETHER:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
-            if "sfp-shutdown-temperature" in self._data:
+            if "sfp-shutdown-temperature" in data:
                 for variable in DEVICE_ATTRIBUTES_IFACE_SFP:
-                    if variable in self._data:
-                        attributes[format_attribute(variable)] = self._data[variable]
+                    value = data.get(variable)
+                    if value is not None:
+                        attributes[format_attribute(variable)] = value
 
-        elif self._data["type"] == "wlan":
+        elif data["type"] == "wlan":
             for variable in DEVICE_ATTRIBUTES_IFACE_WIRELESS:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
         return attributes
 
@@ -120,16 +124,3 @@ class MikrotikClientTrafficSensor(MikrotikSensor):
         """Return the name for this entity"""
         return f"{self.entity_description.name}"
 
-    # @property
-    # def available(self) -> bool:
-    #     """Return if controller and accounting feature in Mikrotik is available.
-    #     Additional check for lan-tx/rx sensors
-    #     """
-    #     if self.entity_description.data_attribute in ["lan-tx", "lan-rx"]:
-    #         return (
-    #             self.coordinator.connected()
-    #             and self._data["available"]
-    #             and self._data["local_accounting"]
-    #         )
-    #     else:
-    #         return self.coordinator.connected() and self._data["available"]
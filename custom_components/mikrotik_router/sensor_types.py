@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
 
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import EntityCategory
@@ -23,7 +22,7 @@ from homeassistant.const import (
 
 from .const import DOMAIN
 
-DEVICE_ATTRIBUTES_IFACE = [
+DEVICE_ATTRIBUTES_IFACE = (
     "running",
     "enabled",
     "comment",
@@ -36,18 +35,18 @@ DEVICE_ATTRIBUTES_IFACE = [
     "actual-mtu",
     "type",
     "name",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_ETHER = [
+DEVICE_ATTRIBUTES_IFACE_ETHER = (
     "status",
     "auto-negotiation",
     "rate",
     "full-duplex",
     "default-name",
     "poe-out",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_SFP = [
+DEVICE_ATTRIBUTES_IFACE_SFP = (
     "status",
     "auto-negotiation",
     "advertising",
@@ -68,9 +67,9 @@ DEVICE_ATTRIBUTES_IFACE_SFP = [
     "sfp-vendor-serial",
     "sfp-manufacturing-date",
     "eeprom-checksum",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
+DEVICE_ATTRIBUTES_IFACE_WIRELESS = (
     "ssid",
     "mode",
     "radio-name",
@@ -91,16 +90,16 @@ DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
     "wds-default-bridge",
     "bridge-mode",
     "hide-ssid",
-]
+)
 
-DEVICE_ATTRIBUTES_CLIENT_TRAFFIC = [
+DEVICE_ATTRIBUTES_CLIENT_TRAFFIC = (
     "address",
     "mac-address",
     "host-name",
     "authorized",
     "bypassed",
-]
-DEVICE_ATTRIBUTES_GPS = [
+)
+DEVICE_ATTRIBUTES_GPS = (
     "valid",
     "latitude",
     "longitude",
@@ -112,7 +111,7 @@ DEVICE_ATTRIBUTES_GPS = [
     "satellites",
     "fix-quality",
     "horizontal-dilution",
-]
+)
 
 
 @dataclass
@@ -128,7 +127,7 @@ class MikrotikSensorEntityDescription(SensorEntityDescription):
     data_name_comment: bool = False
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: list = field(default_factory=lambda: [])
     func: str = "MikrotikSensor"
 
 
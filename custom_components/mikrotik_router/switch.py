@@ -7,7 +7,7 @@ from typing import Any, Optional
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -51,18 +51,15 @@ async def async_setup_entry(
 class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
     """Representation of a switch."""
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if device is on."""
-        return self._data[self.entity_description.data_attribute]
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        if self._data[self.entity_description.data_attribute]:
-            return self.entity_description.icon_enabled
+    @callback
+    def _refresh_entity_attrs(self) -> None:
+        """Recompute cached _attr_* values after _data is rebound."""
+        super()._refresh_entity_attrs()
+        self._attr_is_on = self._data[self.entity_description.data_attribute]
+        if self._attr_is_on:
+            self._attr_icon = self.entity_description.icon_enabled
         else:
-            return self.entity_description.icon_disabled
+            self._attr_icon = self.entity_description.icon_disabled
 
     def turn_on(self, **kwargs: Any) -> None:
         """Required abstract method."""
@@ -72,29 +69,42 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         """Required abstract method."""
         pass
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
+    def _switch_reference(self) -> tuple[str, Any]:
+        """Return the (param, value) pair addressing the row on the router."""
+        param = self.entity_description.data_reference
+        return param, self._data[param]
+
+    @callback
+    def _write_optimistic_state(self, disabled: bool) -> None:
+        """Reflect the toggle locally until the next poll confirms it."""
+        self._data[self.entity_description.data_attribute] = not disabled
+        self._refresh_entity_attrs()
+        self.async_write_ha_state()
+
+    async def _async_set_disabled(self, disabled: bool) -> None:
+        """Write the disabled flag to the router and refresh."""
         if "write" not in self.coordinator.data["access"]:
             return
 
-        path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
+        param, value = self._switch_reference()
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value,
+            self.entity_description.data_switch_path,
+            param,
+            value,
+            self.entity_description.data_switch_parameter,
+            disabled,
+        )
+        self._write_optimistic_state(disabled)
+        await self.coordinator.async_request_refresh()
+
+    async def async_turn_on(self) -> None:
+        """Turn on the switch."""
+        await self._async_set_disabled(False)
 
     async def async_turn_off(self) -> None:
         """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = self.entity_description.data_reference
-        value = self._data[self.entity_description.data_reference]
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+        await self._async_set_disabled(True)
 
 
 # ---------------------------
@@ -107,27 +117,33 @@ class MikrotikPortSwitch(MikrotikSwitch):
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes."""
         attributes = super().extra_state_attributes
+        data = self._data
 
-        if self._data["type"] == "ether":
+        if data["type"] == "ether":
             for variable in DEVICE_ATTRIBUTES_IFACE_ETHER:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
-            if "sfp-shutdown-temperature" in self._data:
+            if "sfp-shutdown-temperature" in data:
                 for variable in DEVICE_ATTRIBUTES_IFACE_SFP:
-                    if variable in self._data:
-                        attributes[format_attribute(variable)] = self._data[variable]
+                    value = data.get(variable)
+                    if value is not None:
+                        attributes[format_attribute(variable)] = value
 
-        elif self._data["type"] == "wlan":
+        elif data["type"] == "wlan":
             for variable in DEVICE_ATTRIBUTES_IFACE_WIRELESS:
-                if variable in self._data:
-                    attributes[format_attribute(variable)] = self._data[variable]
+                value = data.get(variable)
+                if value is not None:
+                    attributes[format_attribute(variable)] = value
 
         return attributes
 
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
+    @callback
+    def _refresh_entity_attrs(self) -> None:
+        """Recompute cached _attr_* values after _data is rebound."""
+        super()._refresh_entity_attrs()
+        self._attr_is_on = self._data[self.entity_description.data_attribute]
         if self._data["running"]:
             icon = self.entity_description.icon_enabled
         else:
@@ -136,7 +152,7 @@ class MikrotikPortSwitch(MikrotikSwitch):
         if not self._data["enabled"]:
             icon = "mdi:lan-disconnect"
 
-        return icon
+        self._attr_icon = icon
 
     async def async_turn_on(self) -> Optional[str]:
         """Turn on the switch."""
@@ -152,13 +168,19 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
 
-        if "poe-out" in self._data and self._data["poe-out"] == "off":
-            path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "auto-on")
+        def _set_values_sync() -> None:
+            """Write both changes over one executor hop."""
+            self.coordinator.set_value(path, param, value, mod_param, False)
+
+            if self._data.get("poe-out") == "off":
+                self.coordinator.set_value(
+                    "/interface/ethernet", param, value, "poe-out", "auto-on"
+                )
 
-        await self.coordinator.async_refresh()
+        await self.hass.async_add_executor_job(_set_values_sync)
+        self._write_optimistic_state(False)
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> Optional[str]:
         """Turn off the switch."""
@@ -174,13 +196,19 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
 
-        if "poe-out" in self._data and self._data["poe-out"] == "auto-on":
-            path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "off")
+        def _set_values_sync() -> None:
+            """Write both changes over one executor hop."""
+            self.coordinator.set_value(path, param, value, mod_param, True)
 
-        await self.coordinator.async_refresh()
+            if self._data.get("poe-out") == "auto-on":
+                self.coordinator.set_value(
+                    "/interface/ethernet", param, value, "poe-out", "off"
+                )
+
+        await self.hass.async_add_executor_job(_set_values_sync)
+        self._write_optimistic_state(True)
+        await self.coordinator.async_request_refresh()
 
 
 # ---------------------------
@@ -189,45 +217,9 @@ class MikrotikPortSwitch(MikrotikSwitch):
 class MikrotikNATSwitch(MikrotikSwitch):
     """Representation of a NAT switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['in-interface']}:{self._data['dst-port']}-"
-                f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["nat"]:
-            if self.coordinator.data["nat"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['in-interface']}:{self._data['dst-port']}-"
-                f"{self._data['out-interface']}:{self._data['to-addresses']}:{self._data['to-ports']}"
-            ):
-                value = self.coordinator.data["nat"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+    def _switch_reference(self) -> tuple[str, Any]:
+        """Return the (param, value) pair addressing the row on the router."""
+        return ".id", self.coordinator.nat_index.get(self._data["uniq-id"])
 
 
 # ---------------------------
@@ -236,47 +228,9 @@ class MikrotikNATSwitch(MikrotikSwitch):
 class MikrotikMangleSwitch(MikrotikSwitch):
     """Representation of a Mangle switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['src-address']}:{self._data['src-port']}-"
-                f"{self._data['dst-address']}:{self._data['dst-port']},"
-                f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["mangle"]:
-            if self.coordinator.data["mangle"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},"
-                f"{self._data['src-address']}:{self._data['src-port']}-"
-                f"{self._data['dst-address']}:{self._data['dst-port']},"
-                f"{self._data['src-address-list']}-{self._data['dst-address-list']}"
-            ):
-                value = self.coordinator.data["mangle"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+    def _switch_reference(self) -> tuple[str, Any]:
+        """Return the (param, value) pair addressing the row on the router."""
+        return ".id", self.coordinator.mangle_index.get(self._data["uniq-id"])
 
 
 # ---------------------------
@@ -285,45 +239,9 @@ class MikrotikMangleSwitch(MikrotikSwitch):
 class MikrotikFilterSwitch(MikrotikSwitch):
     """Representation of a Filter switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
-                f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
-                f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["filter"]:
-            if self.coordinator.data["filter"][uid]["uniq-id"] == (
-                f"{self._data['chain']},{self._data['action']},{self._data['protocol']},{self._data['layer7-protocol']},"
-                f"{self._data['in-interface']},{self._data['in-interface-list']}:{self._data['src-address']},{self._data['src-address-list']}:{self._data['src-port']}-"
-                f"{self._data['out-interface']},{self._data['out-interface-list']}:{self._data['dst-address']},{self._data['dst-address-list']}:{self._data['dst-port']}"
-            ):
-                value = self.coordinator.data["filter"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+    def _switch_reference(self) -> tuple[str, Any]:
+        """Return the (param, value) pair addressing the row on the router."""
+        return ".id", self.coordinator.filter_index.get(self._data["uniq-id"])
 
 
 # ---------------------------
@@ -332,37 +250,10 @@ class MikrotikFilterSwitch(MikrotikSwitch):
 class MikrotikQueueSwitch(MikrotikSwitch):
     """Representation of a queue switch."""
 
-    async def async_turn_on(self) -> None:
-        """Turn on the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["queue"]:
-            if self.coordinator.data["queue"][uid]["name"] == f"{self._data['name']}":
-                value = self.coordinator.data["queue"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
-        await self.coordinator.async_refresh()
-
-    async def async_turn_off(self) -> None:
-        """Turn off the switch."""
-        if "write" not in self.coordinator.data["access"]:
-            return
-
-        path = self.entity_description.data_switch_path
-        param = ".id"
-        value = None
-        for uid in self.coordinator.data["queue"]:
-            if self.coordinator.data["queue"][uid]["name"] == f"{self._data['name']}":
-                value = self.coordinator.data["queue"][uid][".id"]
-
-        mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
-        await self.coordinator.async_refresh()
+    def _switch_reference(self) -> tuple[str, Any]:
+        """Return the (param, value) pair addressing the row on the router."""
+        row = self.coordinator.data["queue"].get(self._data["name"])
+        return ".id", row[".id"] if row else None
 
 
 # ---------------------------
@@ -380,8 +271,10 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "resume"
-        self.coordinator.execute(path, command, param, value)
-        await self.coordinator.async_refresh()
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, path, command, param, value
+        )
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
         """Turn off the switch."""
@@ -392,5 +285,7 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "pause"
-        self.coordinator.execute(path, command, param, value)
-        await self.coordinator.async_refresh()
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, path, command, param, value
+        )
+        await self.coordinator.async_request_refresh()
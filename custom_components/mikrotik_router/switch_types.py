@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.components.switch import (
     SwitchDeviceClass,
@@ -11,7 +10,7 @@ from homeassistant.components.switch import (
 
 from .const import DOMAIN
 
-DEVICE_ATTRIBUTES_IFACE = [
+DEVICE_ATTRIBUTES_IFACE = (
     "running",
     "enabled",
     "comment",
@@ -24,18 +23,18 @@ DEVICE_ATTRIBUTES_IFACE = [
     "actual-mtu",
     "type",
     "name",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_ETHER = [
+DEVICE_ATTRIBUTES_IFACE_ETHER = (
     "status",
     "auto-negotiation",
     "rate",
     "full-duplex",
     "default-name",
     "poe-out",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_SFP = [
+DEVICE_ATTRIBUTES_IFACE_SFP = (
     "status",
     "auto-negotiation",
     "advertising",
@@ -56,9 +55,9 @@ DEVICE_ATTRIBUTES_IFACE_SFP = [
     "sfp-vendor-serial",
     "sfp-manufacturing-date",
     "eeprom-checksum",
-]
+)
 
-DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
+DEVICE_ATTRIBUTES_IFACE_WIRELESS = (
     "ssid",
     "mode",
     "radio-name",
@@ -79,18 +78,18 @@ DEVICE_ATTRIBUTES_IFACE_WIRELESS = [
     "wds-default-bridge",
     "bridge-mode",
     "hide-ssid",
-]
+)
 
-DEVICE_ATTRIBUTES_NAT = [
+DEVICE_ATTRIBUTES_NAT = (
     "protocol",
     "dst-port",
     "in-interface",
     "to-addresses",
     "to-ports",
     "comment",
-]
+)
 
-DEVICE_ATTRIBUTES_MANGLE = [
+DEVICE_ATTRIBUTES_MANGLE = (
     "chain",
     "action",
     "passthrough",
@@ -100,9 +99,9 @@ DEVICE_ATTRIBUTES_MANGLE = [
     "dst-address",
     "dst-port",
     "comment",
-]
+)
 
-DEVICE_ATTRIBUTES_FILTER = [
+DEVICE_ATTRIBUTES_FILTER = (
     "chain",
     "action",
     "address-list",
@@ -117,18 +116,18 @@ DEVICE_ATTRIBUTES_FILTER = [
     "dst-address",
     "dst-port",
     "comment",
-]
+)
 
-DEVICE_ATTRIBUTES_PPP_SECRET = [
+DEVICE_ATTRIBUTES_PPP_SECRET = (
     "connected",
     "service",
     "profile",
     "comment",
     "caller-id",
     "encoding",
-]
+)
 
-DEVICE_ATTRIBUTES_KIDCONTROL = [
+DEVICE_ATTRIBUTES_KIDCONTROL = (
     "blocked",
     "rate-limit",
     "mon",
@@ -138,9 +137,9 @@ DEVICE_ATTRIBUTES_KIDCONTROL = [
     "fri",
     "sat",
     "sun",
-]
+)
 
-DEVICE_ATTRIBUTES_QUEUE = [
+DEVICE_ATTRIBUTES_QUEUE = (
     "target",
     "download-rate",
     "upload-rate",
@@ -157,7 +156,7 @@ DEVICE_ATTRIBUTES_QUEUE = [
     "packet-marks",
     "parent",
     "comment",
-]
+)
 
 
 @dataclass
@@ -179,7 +178,7 @@ class MikrotikSwitchEntityDescription(SwitchEntityDescription):
     data_name_comment: bool = False
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: list = field(default_factory=lambda: [])
     func: str = "MikrotikSwitch"
 
 
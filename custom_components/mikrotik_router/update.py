@@ -86,9 +86,13 @@ class MikrotikRouterOSUpdate(MikrotikEntity, UpdateEntity):
     async def async_install(self, version: str, backup: bool, **kwargs: Any) -> None:
         """Install an update."""
         if backup:
-            self.coordinator.execute("/system/backup", "save", None, None)
+            await self.hass.async_add_executor_job(
+                self.coordinator.execute, "/system/backup", "save", None, None
+            )
 
-        self.coordinator.execute("/system/package/update", "install", None, None)
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system/package/update", "install", None, None
+        )
 
     async def async_release_notes(self) -> str:
         """Return the release notes."""
@@ -161,8 +165,12 @@ class MikrotikRouterBoardFWUpdate(MikrotikEntity, UpdateEntity):
 
     async def async_install(self, version: str, backup: bool, **kwargs: Any) -> None:
         """Install an update."""
-        self.coordinator.execute("/system/routerboard", "upgrade", None, None)
-        self.coordinator.execute("/system", "reboot", None, None)
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system/routerboard", "upgrade", None, None
+        )
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system", "reboot", None, None
+        )
 
 
 async def fetch_changelog(session, version: str) -> str:
@@ -173,7 +181,7 @@ async def fetch_changelog(session, version: str) -> str:
             if response.status == 200:
                 text = await response.text()
                 return text.replace("*) ", "- ")
-    except Exception as e:
+    except Exception:
         pass
     return ""
 